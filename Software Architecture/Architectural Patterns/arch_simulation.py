@@ -16,24 +16,24 @@ import random
 # ==============================================================================
 # 1. MONOLITHIC ARCHITECTURE (Synchronous)
 # ==============================================================================
-def monolithic_order_flow(order_id):
+def monolithic_order_flow(order_id, clock=time):
     print(f"\n[MONOLITH] Starting Order {order_id}...")
     
     # Step 1: Validate (Blocking)
     print(f"   [Controller] -> Calling Service: Validate User...")
-    time.sleep(0.5) # Simulating DB call
+    clock.sleep(0.5) # Simulating DB call
     
     # Step 2: Payment (Blocking)
     print(f"   [Service]    -> Calling Payment Gateway...")
-    time.sleep(0.5) # Simulating API call
+    clock.sleep(0.5) # Simulating API call
     
     # Step 3: Inventory (Blocking)
     print(f"   [Service]    -> Updating Inventory...")
-    time.sleep(0.5) 
+    clock.sleep(0.5) 
     
     # Step 4: Email (Blocking)
     print(f"   [Service]    -> Sending Email...")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     
     print(f"[MONOLITH] Order {order_id} Completed! Execution Time: ~2.0s")
 
@@ -41,8 +41,10 @@ def monolithic_order_flow(order_id):
 # 2. EVENT-DRIVEN ARCHITECTURE (Asynchronous)
 # ==============================================================================
 class EventBus:
-    def __init__(self):
+    def __init__(self, rng=random, clock=time):
         self.queue = queue.Queue()
+        self.rng = rng
+        self.clock = clock
         
     def publish(self, event_type, data):
         print(f"   [EventBus]   <-- Event Published: '{event_type}'")
@@ -56,29 +58,38 @@ class EventBus:
             
     def dispatch(self, event_type, data):
         # In a real system, these would be separate processes/microservices
-        # running in parallel. We simulate this with threads.
+        # running in parallel. We simulate this with threads. The service
+        # times are drawn here, on the calling thread, so a seeded rng gives
+        # the same times whatever the thread scheduling; the clock is
+        # advanced once, by the longest of them, after the threads join.
         if event_type == "OrderPlaced":
-            t1 = threading.Thread(target=self.payment_service, args=(data,))
-            t2 = threading.Thread(target=self.inventory_service, args=(data,))
-            t3 = threading.Thread(target=self.email_service, args=(data,))
-            t1.start(); t2.start(); t3.start()
-            t1.join(); t2.join(); t3.join()
-            
-    def payment_service(self, data):
-        time.sleep(random.uniform(0.1, 0.5))
+            services = (self.payment_service, self.inventory_service, self.email_service)
+            durations = [self.rng.uniform(0.1, 0.5) for _ in services]
+            pause = getattr(self.clock, "pause", self.clock.sleep)
+            threads = [threading.Thread(target=service, args=(data, pause, duration))
+                       for service, duration in zip(services, durations)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            if hasattr(self.clock, "advance"):
+                self.clock.advance(max(durations))
+
+    def payment_service(self, data, pause, duration):
+        pause(duration)
         print(f"   [PaymentSvc] Processed payment for Order {data}")
 
-    def inventory_service(self, data):
-        time.sleep(random.uniform(0.1, 0.5))
+    def inventory_service(self, data, pause, duration):
+        pause(duration)
         print(f"   [StockSvc]   Reserved items for Order {data}")
 
-    def email_service(self, data):
-        time.sleep(random.uniform(0.1, 0.5))
+    def email_service(self, data, pause, duration):
+        pause(duration)
         print(f"   [EmailSvc]   Sent confirmation for Order {data}")
 
-def event_driven_order_flow(order_id):
+def event_driven_order_flow(order_id, rng=random, clock=time):
     print(f"\n[EVENT-DRIVEN] Starting Order {order_id}...")
-    bus = EventBus()
+    bus = EventBus(rng, clock)
     
     # The 'Main' process just publishes an event and returns immediately
     # It doesn't wait for email, inventory, etc.
@@ -89,18 +100,18 @@ def event_driven_order_flow(order_id):
     bus.consume()
     print(f"[EVENT-DRIVEN] All background tasks finished.")
 
-def run_simulation():
+def run_simulation(rng=random, clock=time):
     print("=========================================")
     print("   ARCHITECTURE PATTERN SIMULATION       ")
     print("=========================================")
     
     # Monolith
-    monolithic_order_flow(101)
+    monolithic_order_flow(101, clock)
     
     print("-" * 40)
     
     # Event Driven
-    event_driven_order_flow(202)
+    event_driven_order_flow(202, rng, clock)
 
 if __name__ == "__main__":
     run_simulation()
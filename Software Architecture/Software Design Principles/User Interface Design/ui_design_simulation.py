@@ -182,7 +182,8 @@ class ProgressBar(UIComponent):
 class GoldenRulesDemo:
     """Demonstrates Theo Mandel's Three Golden Rules of UI Design."""
     
-    def __init__(self):
+    def __init__(self, clock=time):
+        self.clock = clock
         self.action_history: List[str] = []
         self.user_preferences: Dict[str, any] = {}
         self.current_context: str = "Main Menu"
@@ -217,7 +218,7 @@ class GoldenRulesDemo:
         for action in actions:
             self.action_history.append(action)
             print(f"      ▶ {action}")
-            time.sleep(0.2)
+            self.clock.sleep(0.2)
         
         print("\n   User presses Ctrl+Z (Undo):")
         if self.action_history:
@@ -325,7 +326,8 @@ class GoldenRulesDemo:
 class UIDesignSimulation:
     """Simulates the complete UI Design process through all four phases."""
     
-    def __init__(self, project_name: str = "Sample Application"):
+    def __init__(self, project_name: str = "Sample Application", clock=time):
+        self.clock = clock
         self.project_name = project_name
         self.current_phase = UIPhase.ANALYSIS
         self.phase_progress: Dict[UIPhase, float] = {phase: 0.0 for phase in UIPhase}
@@ -476,7 +478,7 @@ class UIDesignSimulation:
         for i in range(0, 101, 20):
             upload_progress.update(i / 100)
             print(f"   {upload_progress.render()}")
-            time.sleep(0.2)
+            self.clock.sleep(0.2)
             self._update_progress(0.05)
         
         self.phase_progress[UIPhase.IMPLEMENTATION] = 1.0
@@ -505,7 +507,7 @@ class UIDesignSimulation:
             status = "✅ PASSED" if passed else "❌ FAILED"
             print(f"   {status} - {test_name}: {description}")
             self._update_progress(0.15)
-            time.sleep(0.2)
+            self.clock.sleep(0.2)
         
         # Summary
         passed_count = sum(self.validation_results.values())
@@ -611,7 +613,7 @@ def interactive_demo():
             print("❌ Invalid choice. Please enter 1-5.")
 
 
-def _component_demo():
+def _component_demo(clock=time):
     """Interactive demo of UI components."""
     print("\n" + "-" * 40)
     print("🧩 UI COMPONENTS DEMO")
@@ -641,7 +643,7 @@ def _component_demo():
     for i in range(0, 101, 25):
         progress.update(i / 100)
         print(progress.render())
-        time.sleep(0.3)
+        clock.sleep(0.3)
 
 
 def _ui_types_comparison():
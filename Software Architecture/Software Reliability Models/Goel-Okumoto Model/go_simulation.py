@@ -6,7 +6,16 @@ It shows how the number of bugs found plateaus over time as 'a' is reached.
 """
 
 import math
+import os
+import sys
 import time
+from collections import namedtuple
+from statistics import NormalDist
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_numeric import broadcast_params, find_root, is_scalar
 
 def goel_okumoto_mean(t, a, b):
     """
@@ -14,7 +23,272 @@ def goel_okumoto_mean(t, a, b):
     """
     return a * (1 - math.exp(-b * t))
 
-def run_simulation():
+# ------------------------------------------------------------------------------
+# Grid evaluation
+# ------------------------------------------------------------------------------
+# The functions below evaluate the model over a whole time grid in one pass.
+# 't' may be a number or any iterable of numbers (list, range, array.array,
+# NumPy array, ...). 'a' and 'b' may also be sequences, one entry per
+# component; they are broadcast against each other like NumPy would
+# (sim_numeric.broadcast_params).
+#
+#   scalar t, scalar a/b     -> float
+#   grid t,   scalar a/b     -> list of floats (one per time point)
+#   any t,    sequence a/b   -> list with one result per component
+
+def _decay(t, b):
+    """exp(-b*t) for every point of the grid 't' (a list)."""
+    exp = math.exp
+    return [exp(-b * x) for x in t]
+
+def _evaluate(kernel, t, a, b):
+    """Applies kernel(t_list, a, b) -> list over the parameter grid."""
+    scalar_t = is_scalar(t)
+    t_list = [float(t)] if scalar_t else [float(x) for x in t]
+    params = broadcast_params(a, b)
+
+    def one(a_i, b_i):
+        row = kernel(t_list, a_i, b_i)
+        return row[0] if scalar_t else row
+
+    if params is None:
+        return one(float(a), float(b))
+    return [one(a_i, b_i) for a_i, b_i in zip(*params)]
+
+def _mean_kernel(t, a, b):
+    exp = math.exp
+    return [a - a * exp(-b * x) for x in t]
+
+def _intensity_kernel(t, a, b):
+    exp = math.exp
+    ab = a * b
+    return [ab * exp(-b * x) for x in t]
+
+def _increments_kernel(t, a, b):
+    # m(t_k) - m(t_{k-1}) = a * (exp(-b*t_{k-1}) - exp(-b*t_k)), with m(t_{-1}) = 0
+    decay = _decay(t, b)
+    previous = [1.0] + decay[:-1]
+    return [a * (p - e) for p, e in zip(previous, decay)]
+
+def goel_okumoto_curve(t, a, b):
+    """
+    Calculates m(t) = a * (1 - exp(-b*t)) over a whole time grid.
+    """
+    return _evaluate(_mean_kernel, t, a, b)
+
+def goel_okumoto_intensity(t, a, b):
+    """
+    Calculates the failure intensity lambda(t) = a * b * exp(-b*t).
+    """
+    return _evaluate(_intensity_kernel, t, a, b)
+
+def goel_okumoto_increments(t, a, b):
+    """
+    Calculates the expected new failures per interval, m(t_k) - m(t_{k-1}).
+    The first interval is measured from m = 0 (same as run_simulation).
+    """
+    return _evaluate(_increments_kernel, t, a, b)
+
+# ------------------------------------------------------------------------------
+# Release readiness: time until a target is reached
+# ------------------------------------------------------------------------------
+# All three questions have closed forms for G-O:
+#   remaining faults  a*exp(-b*t) <= K          ->  t = ln(a / K) / b
+#   mean value        m(t) = target             ->  t = -ln(1 - target/a) / b
+#   reliability       R(x | t) = exp(-(m(t+x) - m(t))) >= R
+#                     a*exp(-b*t)*(1 - exp(-b*x)) <= -ln(R)
+#                                               ->  t = ln(a*(1-exp(-b*x)) / -ln(R)) / b
+# Every argument may be a sequence (one entry per service); they broadcast
+# against each other and a list is returned. Unreachable targets give inf;
+# targets already met give 0.
+
+def _solve_each(solver, *values):
+    params = broadcast_params(*values)
+    if params is None:
+        return solver(*(float(v) for v in values))
+    return [solver(*row) for row in zip(*params)]
+
+def _time_to_remaining(K, a, b):
+    if a <= K:
+        return 0.0
+    if K <= 0:
+        return math.inf
+    return math.log(a / K) / b
+
+def _time_to_mean(target, a, b):
+    if target <= 0:
+        return 0.0
+    if target >= a:
+        return math.inf
+    return -math.log1p(-target / a) / b
+
+def _time_to_reliability(R, mission, a, b):
+    if R <= 0:
+        return 0.0
+    if R >= 1:
+        return math.inf
+    exposure = a * -math.expm1(-b * mission)
+    allowed = -math.log(R)
+    if exposure <= allowed:
+        return 0.0
+    return math.log(exposure / allowed) / b
+
+def goel_okumoto_time_to_remaining(K, a, b):
+    """Test time until the expected remaining faults a - m(t) fall to K."""
+    return _solve_each(_time_to_remaining, K, a, b)
+
+def goel_okumoto_time_to_mean(target, a, b):
+    """Test time until m(t) reaches 'target' detected faults."""
+    return _solve_each(_time_to_mean, target, a, b)
+
+def goel_okumoto_time_to_reliability(R, mission, a, b):
+    """
+    Test time after which the system survives a further 'mission' time
+    without failure with probability at least R.
+    """
+    return _solve_each(_time_to_reliability, R, mission, a, b)
+
+# ------------------------------------------------------------------------------
+# Maximum-likelihood fitting
+# ------------------------------------------------------------------------------
+# For a fixed b the likelihood is maximised by a closed form
+#     a(b) = n / (1 - exp(-b*T))
+# so only a 1-D equation in b has to be solved. The data is reduced to a few
+# sufficient statistics first (n, sum of times, T), which makes every solver
+# iteration O(1) no matter how many failures were observed.
+
+GOFit = namedtuple("GOFit", "a b a_ci b_ci log_likelihood n_failures observation_end")
+
+def _expm1_safe(x):
+    return math.inf if x > 700 else math.expm1(x)
+
+def _wald_interval(value, std_err, confidence):
+    """Interval computed on the log scale so it always stays positive."""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    spread = math.exp(z * std_err / value)
+    return value / spread, value * spread
+
+def _confidence_intervals(a, b, info_aa, info_ab, info_bb, confidence):
+    det = info_aa * info_bb - info_ab * info_ab
+    if det <= 0:
+        return (math.nan, math.nan), (math.nan, math.nan)
+    se_a = math.sqrt(info_bb / det)
+    se_b = math.sqrt(info_aa / det)
+    return _wald_interval(a, se_a, confidence), _wald_interval(b, se_b, confidence)
+
+def fit_goel_okumoto(failure_times, observation_end=None, confidence=0.95):
+    """
+    Fits a and b to individual failure times (time-truncated at 'observation_end',
+    or failure-truncated at the last failure when it is not given).
+
+    Returns a GOFit with the estimates and their confidence intervals.
+    Raises ValueError if the data shows no reliability growth (no finite MLE).
+    """
+    times = failure_times if hasattr(failure_times, "__len__") else list(failure_times)
+    n = len(times)
+    if n == 0:
+        raise ValueError("At least one failure time is required")
+    total = float(sum(times))
+    last = float(max(times))
+    T = last if observation_end is None else float(observation_end)
+    if min(times) < 0 or T < last or T <= 0:
+        raise ValueError("Failure times must lie in [0, observation_end]")
+    return fit_goel_okumoto_statistics(n, total, T, confidence)
+
+def fit_goel_okumoto_statistics(n, total, observation_end, confidence=0.95):
+    """
+    Same as fit_goel_okumoto, from the sufficient statistics: the number of
+    failures, the sum of their times and the end of the observation window.
+    """
+    T = observation_end
+
+    # With x = b*T the profile score is  1/x - 1/(e^x - 1) = mean(t) / T.
+    # The left side falls from 1/2 to 0, so a root exists only if mean(t) < T/2.
+    ratio = total / (n * T)
+    if not 0 < ratio < 0.5:
+        raise ValueError("No finite MLE: failures are not concentrated early enough "
+                         "(mean failure time must be below half the observation window)")
+
+    def score(x):
+        return 1.0 / x - 1.0 / _expm1_safe(x) - ratio
+
+    def score_prime(x):
+        if x > 700:
+            return -1.0 / (x * x)
+        em1 = math.expm1(x)
+        return -1.0 / (x * x) + (em1 + 1.0) / (em1 * em1)
+
+    x = find_root(score, 1e-9, 1.0 / ratio, score_prime)
+    b = x / T
+    decay = math.exp(-x)
+    a = n / (1.0 - decay)
+    log_likelihood = n * math.log(a * b) - b * total - n
+
+    # Observed information matrix
+    info_aa = n / (a * a)
+    info_ab = T * decay
+    info_bb = n / (b * b) - a * T * T * decay
+    a_ci, b_ci = _confidence_intervals(a, b, info_aa, info_ab, info_bb, confidence)
+    return GOFit(a, b, a_ci, b_ci, log_likelihood, n, T)
+
+def fit_goel_okumoto_grouped(interval_ends, counts, confidence=0.95):
+    """
+    Fits a and b to grouped data: counts[i] failures observed in the
+    interval (interval_ends[i-1], interval_ends[i]], starting from time 0
+    (e.g. weekly defect counts with interval_ends = 1, 2, 3, ...).
+
+    Returns a GOFit; raises ValueError if no finite MLE exists.
+    """
+    ends = [float(s) for s in interval_ends]
+    ys = [float(y) for y in counts]
+    if not ends or len(ends) != len(ys):
+        raise ValueError("interval_ends and counts must be non-empty and of equal length")
+    starts = [0.0] + ends[:-1]
+    if any(e <= s for s, e in zip(starts, ends)) or any(y < 0 for y in ys):
+        raise ValueError("interval_ends must be increasing and counts non-negative")
+    n = sum(ys)
+    if n == 0:
+        raise ValueError("At least one failure is required")
+    T = ends[-1]
+    groups = [(s, e, y) for s, e, y in zip(starts, ends, ys) if y > 0]
+
+    def score(b):
+        total = 0.0
+        for s, e, y in groups:
+            q = math.exp(-b * (e - s))
+            total += y * (e * q - s) / -math.expm1(-b * (e - s))
+        return total - n * T / _expm1_safe(b * T)
+
+    lo = 1e-9 / T
+    if score(lo) <= 0:
+        raise ValueError("No finite MLE: the grouped counts show no reliability growth")
+    hi = 1.0 / T
+    while score(hi) > 0:
+        hi *= 2.0
+        if hi * T > 700:
+            raise ValueError("No finite MLE: detection rate diverges")
+    b = find_root(score, lo, hi)
+    a = n / -math.expm1(-b * T)
+
+    # Expected information: sum over intervals of grad(dm) grad(dm)^T / dm
+    info_aa = info_ab = info_bb = 0.0
+    log_likelihood = -n  # -m(T), and m(T) = n at the MLE
+    for s, e, y in zip(starts, ends, ys):
+        es, ee = math.exp(-b * s), math.exp(-b * e)
+        dm = a * (es - ee)
+        if dm <= 0:
+            continue
+        d_a = es - ee
+        d_b = a * (e * ee - s * es)
+        info_aa += d_a * d_a / dm
+        info_ab += d_a * d_b / dm
+        info_bb += d_b * d_b / dm
+        if y > 0:
+            log_likelihood += y * math.log(dm) - math.lgamma(y + 1)
+    a_ci, b_ci = _confidence_intervals(a, b, info_aa, info_ab, info_bb, confidence)
+    return GOFit(a, b, a_ci, b_ci, log_likelihood, int(n), T)
+
+def run_simulation(clock=time):
     print("=========================================")
     print("   GOEL-OKUMOTO MODEL SIMULATION         ")
     print("=========================================")
@@ -31,20 +305,15 @@ def run_simulation():
     print(f"{'Week':<10} | {'Cumulative Failures (m(t))':<30} | {'Progress'}")
     print("-" * 55)
 
-    previous_m = 0
+    weeks = range(0, 26)
+    curve = goel_okumoto_curve(weeks, param_a, param_b)
     
-    for t in range(0, 26):
-        m_t = goel_okumoto_mean(t, param_a, param_b)
-        
-        # New bugs found this week
-        new_bugs = m_t - previous_m
-        previous_m = m_t
-        
+    for t, m_t in zip(weeks, curve):
         # Visual Bar (Total)
         bar = "█" * int(m_t / 5) 
         
         print(f"{t:<10} | {m_t:<30.2f} | {bar}")
-        time.sleep(0.1)
+        clock.sleep(0.1)
 
     print("-" * 55)
     print("\nAnalysis:")
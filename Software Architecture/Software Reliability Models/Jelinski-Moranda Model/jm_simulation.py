@@ -6,11 +6,21 @@ As we fix bugs, the 'Lambda' (Failure Rate) decreases,
 and the 'MTBF' (Mean Time Between Failures) increases.
 """
 
+import os
+import sys
 import random
 import math
+import operator
 import time
+from collections import namedtuple
 
-def simulate_failure_time(failure_rate):
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_numeric import quantile
+from sim_random import batched
+
+def simulate_failure_time(failure_rate, rng=random):
     """
     Generates a random time interval based on Exponential Distribution.
     t = -ln(U) / lambda
@@ -18,10 +28,177 @@ def simulate_failure_time(failure_rate):
     if failure_rate <= 0:
         return float('inf') # No more failures possible!
     
-    u = random.random()
+    u = rng.random()
     return -math.log(u) / failure_rate
 
-def run_simulation():
+# ------------------------------------------------------------------------------
+# Batch Monte Carlo
+# ------------------------------------------------------------------------------
+# A debugging history is the list of N inter-failure times, where the i-th
+# time is Exponential with rate phi * (N - (i-1)). Histories are drawn from
+# the 'rng' stream replica after replica, so a seeded stream produces the same
+# histories whatever chunk size is used.
+
+def _mean_times(N, phi, faults):
+    faults = N if faults is None else faults
+    if not 0 < faults <= N:
+        raise ValueError(f"faults must be in 1..{N}")
+    if phi <= 0:
+        raise ValueError("phi must be positive")
+    return [1.0 / (phi * (N - i)) for i in range(faults)]
+
+def iter_failure_history_chunks(N, phi, replicas, chunk_size=10000, faults=None, rng=random):
+    """
+    Yields lists of at most 'chunk_size' simulated histories. Each history is
+    the list of the first 'faults' (default: all N) inter-failure times.
+    Only one chunk is held in memory at a time.
+    """
+    means = _mean_times(N, phi, faults)
+    exponentials = batched(rng).exponentials
+    faults = len(means)
+    remaining = replicas
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield [list(map(operator.mul, exponentials(faults), means)) for _ in range(size)]
+        remaining -= size
+
+def simulate_failure_histories(N, phi, replicas, faults=None, rng=random):
+    """Returns all simulated histories as a list of lists (replicas x faults)."""
+    histories = []
+    for chunk in iter_failure_history_chunks(N, phi, replicas, faults=faults, rng=rng):
+        histories.extend(chunk)
+    return histories
+
+def summarize_failure_histories(N, phi, replicas, k=None, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95),
+                                chunk_size=10000, rng=random):
+    """
+    Simulates 'replicas' histories and summarises the total test time and the
+    time to the k-th failure (default k = N) without keeping the paths:
+    only two numbers per replica are retained.
+
+    Returns a dict:
+      {"total_time": {"mean": ..., "quantiles": {q: value}},
+       "time_to_kth": {"k": k, "mean": ..., "quantiles": {q: value}}}
+    """
+    k = N if k is None else k
+    if not 0 < k <= N:
+        raise ValueError(f"k must be in 1..{N}")
+    totals = []
+    kth_times = []
+    for chunk in iter_failure_history_chunks(N, phi, replicas, chunk_size, rng=rng):
+        for history in chunk:
+            kth = sum(history[:k])
+            kth_times.append(kth)
+            totals.append(kth + sum(history[k:]))
+
+    def describe(values):
+        values.sort()
+        return {
+            "mean": math.fsum(values) / len(values),
+            "quantiles": {q: quantile(values, q) for q in quantiles},
+        }
+
+    time_to_kth = describe(kth_times)
+    time_to_kth["k"] = k
+    return {"total_time": describe(totals), "time_to_kth": time_to_kth}
+
+# ------------------------------------------------------------------------------
+# Maximum-likelihood estimation of N and phi
+# ------------------------------------------------------------------------------
+# For observed inter-failure times x_1..x_n the likelihood equations are
+#     phi = n / sum((N - i + 1) * x_i)
+#     sum_{i=1..n} 1 / (N - i + 1) = n * S / (N * S - W)
+# with S = sum(x_i) and W = sum((i - 1) * x_i). The harmonic sum on the left
+# equals digamma(N + 1) - digamma(N - n + 1), so after one pass over the data
+# each solver step is O(1). N cannot be below the n faults already found: if
+# the root lies under n, the estimate is N = n (no faults remain, failure
+# rate 0, MTBF inf).
+
+JMFit = namedtuple("JMFit", "N phi n_failures remaining failure_rate expected_mtbf log_likelihood")
+
+def _digamma(x):
+    """Digamma function for x > 0 (recurrence + asymptotic series)."""
+    result = 0.0
+    while x < 6.0:
+        result -= 1.0 / x
+        x += 1.0
+    inv2 = 1.0 / (x * x)
+    series = inv2 * (1 / 12 - inv2 * (1 / 120 - inv2 * (1 / 252 - inv2 * (1 / 240 - inv2 / 132))))
+    return result + math.log(x) - 0.5 / x - series
+
+def _interval_statistics(intervals):
+    """Returns (n, S, W) in a single pass over the data."""
+    xs = intervals if hasattr(intervals, "__len__") else list(intervals)
+    n = len(xs)
+    S = float(sum(xs))
+    W = float(sum(map(operator.mul, range(n), xs)))
+    return n, S, W
+
+def jm_finite_mle_exists(intervals):
+    """
+    A finite estimate of N exists only if the data shows reliability growth:
+    W / S > (n - 1) / 2, i.e. later intervals are longer on average.
+    """
+    n, S, W = _interval_statistics(intervals)
+    return n >= 2 and S > 0 and W / S > (n - 1) / 2
+
+def fit_jelinski_moranda(intervals, tol=1e-10):
+    """
+    Estimates N (as a real number, at least n) and phi from inter-failure
+    times. Raises ValueError if there is no finite maximum-likelihood estimate.
+    """
+    n, S, W = _interval_statistics(intervals)
+    return fit_jelinski_moranda_statistics(n, S, W, tol)
+
+def fit_jelinski_moranda_statistics(n, S, W, tol=1e-10):
+    """
+    Same as fit_jelinski_moranda, from the sufficient statistics
+    n, S = sum(x_i) and W = sum((i - 1) * x_i).
+    """
+    if n < 2 or S <= 0:
+        raise ValueError("At least two positive inter-failure times are required")
+    if W / S <= (n - 1) / 2:
+        raise ValueError("No finite MLE: the inter-failure times show no reliability growth")
+
+    def score(N):
+        return _digamma(N + 1) - _digamma(N - n + 1) - n * S / (N * S - W)
+
+    # score < 0 for large N. If it is already <= 0 at N = n the likelihood
+    # falls over all of N >= n, so N = n. Otherwise bracket the root above n,
+    # then refine with regula falsi (Illinois variant, which avoids stalling
+    # on one end of the bracket).
+    lo = hi = N = float(n)
+    iterations = 0 if score(lo) <= 0 else 200
+    if iterations:
+        hi = 2.0 * lo
+        while score(hi) > 0:
+            lo, hi = hi, 2.0 * hi
+    f_lo, f_hi = score(lo), score(hi)
+    side = 0
+    for _ in range(iterations):
+        N = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+        f_N = score(N)
+        if f_N > 0:
+            lo, f_lo = N, f_N
+            if side == 1:
+                f_hi *= 0.5
+            side = 1
+        else:
+            hi, f_hi = N, f_N
+            if side == -1:
+                f_lo *= 0.5
+            side = -1
+        if hi - lo <= tol * N or f_N == 0:
+            break
+
+    phi = n / (N * S - W)
+    remaining = N - n
+    failure_rate = phi * remaining
+    expected_mtbf = 1.0 / failure_rate if failure_rate > 0 else math.inf
+    log_likelihood = math.lgamma(N + 1) - math.lgamma(N - n + 1) + n * math.log(phi) - n
+    return JMFit(N, phi, n, remaining, failure_rate, expected_mtbf, log_likelihood)
+
+def run_simulation(rng=random, clock=time):
     print("=========================================")
     print("   JELINSKI-MORANDA MODEL SIMULATION     ")
     print("=========================================")
@@ -45,11 +222,11 @@ def run_simulation():
         expected_mtbf = 1.0 / lambd
         
         # Simulate actual time to find this bug
-        actual_time = simulate_failure_time(lambd)
+        actual_time = simulate_failure_time(lambd, rng)
         total_time += actual_time
         
         print(f"{i:<10} | {remaining:<10} | {lambd:<20.4f} | {expected_mtbf:<20.2f} | {actual_time:.2f}")
-        time.sleep(0.1)
+        clock.sleep(0.1)
         
         if i >= 15:
             print("... (Stopping simulation early as MTBF gets huge) ...")
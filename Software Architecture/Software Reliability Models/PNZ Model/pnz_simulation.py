@@ -8,8 +8,19 @@ accounting for:
 2. Imperfect Debugging (New bugs introduced while fixing old ones).
 """
 
+import itertools
 import math
+import operator
+import os
+import sys
 import time
+from collections import namedtuple
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_numeric import broadcast_params, find_root, is_scalar
+from sim_parallel import map_chunks
 
 def pnz_mean_value_function(t, a, b, alpha, beta):
     """
@@ -21,18 +32,428 @@ def pnz_mean_value_function(t, a, b, alpha, beta):
     b     : Fault detection rate
     alpha : Fault introduction rate (imperfect debugging)
     beta  : Inflection factor (S-shape parameter)
+
+    beta == 0 is handled by its limit (see _pnz_value); with alpha != 0 that
+    limit diverges and a ValueError is raised.
     """
-    try:
-        term1 = (1 - math.exp(-b * t)) * (1 - (alpha / beta))
-        term2 = alpha * t
-        numerator = a * (term1 + term2)
-        denominator = 1 + beta * math.exp(-b * t)
-        
-        return numerator / denominator
-    except ZeroDivisionError:
-        return 0
+    return _pnz_value(t, a, alpha, beta, math.exp(-b * t), -math.expm1(-b * t))
+
+def _pnz_value(t, a, alpha, beta, decay, growth):
+    """
+    m(t) from precomputed decay = exp(-b*t) and growth = 1 - exp(-b*t)
+    (growth via expm1, so it stays accurate when b*t is tiny).
+
+    As beta -> 0+ the factor (1 - alpha/beta) diverges, so the limit is:
+      - a * alpha * t            if growth == 0 (t == 0 or b == 0)
+      - a * growth               if alpha == 0 (the G-O curve)
+    and otherwise m(t) has no finite value: ValueError.
+    """
+    denominator = 1 + beta * decay
+    if beta == 0:
+        if growth == 0:
+            return float(a * alpha * t)
+        if alpha == 0:
+            return a * growth
+        raise ValueError("PNZ is undefined for beta = 0 with alpha != 0 (m(t) diverges)")
+    if denominator == 0:
+        return math.nan
+    numerator = a * (growth * (1 - alpha / beta) + alpha * t)
+    return numerator / denominator
+
+def pnz_intensity(t, a, b, alpha, beta):
+    """
+    Calculates the failure intensity lambda(t) = dm/dt.
+    """
+    E = math.exp(-b * t)
+    if beta == 0:
+        # Finite only on the G-O branch of the beta -> 0 limit
+        if alpha != 0:
+            raise ValueError("PNZ is undefined for beta = 0 with alpha != 0 (lambda(t) diverges)")
+        return a * b * E
+    G = -math.expm1(-b * t)
+    D = 1 + beta * E
+    K = 1 - alpha / beta
+    P = G * K + alpha * t
+    return a * ((b * E * K + alpha) * D + P * b * beta * E) / (D * D)
+
+# ------------------------------------------------------------------------------
+# Grid evaluation and parameter sweeps
+# ------------------------------------------------------------------------------
+# pnz_mean_curve evaluates m(t) over a whole time grid. 't' may be a number
+# or any iterable of numbers; a, b, alpha and beta may each be a number or
+# a sequence (one entry per parameter set), broadcast against each other
+# (sim_numeric.broadcast_params).
+#
+#   scalar t, scalar params   -> float
+#   grid t,   scalar params   -> list of floats
+#   any t,    sequence params -> list with one result per parameter set
+
+def _pnz_rows(t_list, parameter_sets, strict=True):
+    """
+    Evaluates each (a, b, alpha, beta) over t_list, reusing exp(-b*t) per b.
+    An undefined parameter set raises ValueError, or gives None if not strict.
+    """
+    exp, expm1 = math.exp, math.expm1
+    cache = {}
+    rows = []
+    for a, b, alpha, beta in parameter_sets:
+        terms = cache.get(b)
+        if terms is None:
+            terms = cache[b] = ([exp(-b * x) for x in t_list],
+                                [-expm1(-b * x) for x in t_list])
+        decays, growths = terms
+        row = None
+        # The denominator 1 + beta*decay can only vanish for beta < 0; such
+        # rows (and beta == 0) go point by point through _pnz_value
+        if beta > 0 or (beta < 0 and all(1 + beta * d != 0 for d in decays)):
+            # m = (k*growth + c*t) / (1 + beta*decay), the formula of _pnz_value
+            k = a * (1 - alpha / beta)
+            c = a * alpha
+            row = [(k * g + c * x) / (1 + beta * d)
+                   for x, d, g in zip(t_list, decays, growths)]
+        else:
+            try:
+                row = [_pnz_value(x, a, alpha, beta, d, g)
+                       for x, d, g in zip(t_list, decays, growths)]
+            except ValueError:
+                if strict:
+                    raise
+        rows.append(row)
+    return rows
+
+def pnz_mean_curve(t, a, b, alpha, beta):
+    """
+    Calculates m(t) for a time grid and/or several parameter sets at once.
+    """
+    scalar_t = is_scalar(t)
+    t_list = [float(t)] if scalar_t else [float(x) for x in t]
+    columns = broadcast_params(a, b, alpha, beta)
+    scalar_params = columns is None
+    if scalar_params:
+        columns = [[float(a)], [float(b)], [float(alpha)], [float(beta)]]
+
+    rows = _pnz_rows(t_list, zip(*columns))
+    if scalar_t:
+        rows = [row[0] for row in rows]
+    return rows[0] if scalar_params else rows
+
+def _sweep_chunk(parameter_sets, t_list, scalar_t):
+    rows = _pnz_rows(t_list, parameter_sets, strict=False)
+    return [row[0] if row is not None else None for row in rows] if scalar_t else rows
+
+def pnz_parameter_sweep(t, a_values, b_values, alpha_values, beta_values,
+                        chunk_size=10000, processes=None):
+    """
+    Evaluates m(t) for every combination in the Cartesian product of the
+    four value lists, in itertools.product order (beta varies fastest).
+
+    The product is split into chunks of 'chunk_size' combinations that are
+    evaluated on a process pool ('processes' workers, default: all cores).
+    processes=1 evaluates in the current process.
+
+    Returns one entry per combination: a float for scalar t, else a list.
+    Combinations the model is undefined for (beta = 0 with alpha != 0) give
+    None, so they cannot leak +-inf into aggregates over the sweep.
+    """
+    scalar_t = is_scalar(t)
+    t_list = [float(t)] if scalar_t else [float(x) for x in t]
+    combos = itertools.product(a_values, b_values, alpha_values, beta_values)
+    chunks = iter(lambda: list(itertools.islice(combos, chunk_size)), [])
+    return map_chunks(_sweep_chunk, chunks, (t_list, scalar_t), processes)
+
+# ------------------------------------------------------------------------------
+# Release readiness: time until a target is reached
+# ------------------------------------------------------------------------------
+# PNZ has no closed-form inverse, so each question becomes a root of
+#     f(t) = m(t) - target                       (f' = lambda(t))
+#     g(t) = m(t + x) - m(t) + ln(R)             (g' = lambda(t+x) - lambda(t))
+# found by bracketed Newton, with Newton steps that leave the bracket
+# replaced by bisection.
+#
+# For beta > 0 the intensity first rises (S-shape) and then falls, so g is
+# not monotonic: a target met at t = 0 can be lost and only met again after
+# the peak. The answer is therefore the LAST crossing, the time after which
+# the target stays met. f and g are scanned on a grid of step 1/(16b) up to
+# ln(beta)/b + 10/b, where exp(-b*t) has died out and only the monotonic tail
+# remains, and the bracket is grown by doubling beyond that up to 'horizon'.
+# Arguments broadcast like pnz_mean_curve. Targets never reached within the
+# horizon give inf; targets met from t = 0 onwards give 0.
+
+_SCAN_STEPS_PER_SCALE = 16
+_MAX_SCAN_POINTS = 4096
+
+def _last_crossing(f, fprime, b, beta, horizon):
+    """Smallest t >= 0 with f(s) <= 0 for every s >= t (up to 'horizon')."""
+    # Scan the S-shaped part, where f may change sign several times
+    settle = 0.0
+    if b > 0:
+        settle = min((math.log(beta) if beta > 1 else 0.0) / b + 10.0 / b, horizon)
+    points = min(int(settle * b * _SCAN_STEPS_PER_SCALE) + 1, _MAX_SCAN_POINTS) if settle else 0
+    grid = [settle * k / points for k in range(points + 1)] if points else [0.0]
+    values = [f(t) for t in grid]
+    if values[-1] <= 0:
+        last = max((k for k, v in enumerate(values) if v > 0), default=None)
+        if last is None:
+            return 0.0
+        return find_root(f, grid[last], grid[last + 1], fprime, tol=1e-10)
+
+    # Beyond it f is monotonic: grow the bracket by doubling
+    lo = grid[-1]
+    if lo >= horizon:
+        return math.inf
+    hi = min(max(2.0 * lo, 1.0 / b if b > 0 else 1.0), horizon)
+    while f(hi) > 0:
+        if hi >= horizon:
+            return math.inf
+        lo, hi = hi, min(2.0 * hi, horizon)
+    return find_root(f, lo, hi, fprime, tol=1e-10)
+
+def _time_to_mean(target, a, b, alpha, beta, horizon):
+    return _last_crossing(
+        lambda t: target - pnz_mean_value_function(t, a, b, alpha, beta),
+        lambda t: -pnz_intensity(t, a, b, alpha, beta),
+        b, beta, horizon)
+
+def _time_to_reliability(R, mission, a, b, alpha, beta, horizon):
+    if R <= 0:
+        return 0.0
+    if R >= 1:
+        return math.inf
+    allowed = -math.log(R)
+    m = pnz_mean_value_function
+    rate = pnz_intensity
+    return _last_crossing(
+        lambda t: m(t + mission, a, b, alpha, beta) - m(t, a, b, alpha, beta) - allowed,
+        lambda t: rate(t + mission, a, b, alpha, beta) - rate(t, a, b, alpha, beta),
+        b, beta, horizon)
+
+def pnz_time_to_mean(target, a, b, alpha, beta, horizon=1e6):
+    """Test time until m(t) reaches 'target' detected faults."""
+    params = broadcast_params(target, a, b, alpha, beta)
+    if params is None:
+        return _time_to_mean(target, a, b, alpha, beta, horizon)
+    return [_time_to_mean(*row, horizon) for row in zip(*params)]
+
+def pnz_time_to_reliability(R, mission, a, b, alpha, beta, horizon=1e6):
+    """
+    Test time after which the system survives a further 'mission' time
+    without failure with probability at least R. With alpha > 0 new faults
+    keep arriving, so high targets may never be reached (inf).
+    """
+    params = broadcast_params(R, mission, a, b, alpha, beta)
+    if params is None:
+        return _time_to_reliability(R, mission, a, b, alpha, beta, horizon)
+    return [_time_to_reliability(*row, horizon) for row in zip(*params)]
+
+# ------------------------------------------------------------------------------
+# Least-squares fitting to cumulative failure data
+# ------------------------------------------------------------------------------
+# Minimises sum((m(t_k) - y_k)^2). With E = exp(-b*t), G = 1 - E,
+# D = 1 + beta*E, K = 1 - alpha/beta and P = G*K + alpha*t (so m = a*P/D)
+# the analytic Jacobian is
+#     dm/da     = P / D
+#     dm/db     = a * t * E * (K*D + beta*P) / D^2
+#     dm/dalpha = a * (t - G/beta) / D
+#     dm/dbeta  = a * (alpha*G*D/beta^2 - P*E) / D^2
+#
+# Writing c = a*alpha, m = (a*G + c*(t - G/beta)) / D is linear in (a, c).
+# So for any (b, beta) the best a and c follow from a 2x2 linear solve, and
+# Levenberg-Marquardt only has to search the two non-linear parameters
+# (b, beta) (variable projection). This avoids the long a/alpha valley a
+# plain 4-parameter search crawls along.
+
+PNZFit = namedtuple("PNZFit", "a b alpha beta sse r_squared aic bic n_points iterations converged")
+
+PNZ_PARAMETER_COUNT = 4
+
+def _pnz_jacobian_row(t, a, b, alpha, beta):
+    """Returns (m(t), (dm/da, dm/db, dm/dalpha, dm/dbeta)) for beta > 0."""
+    E = math.exp(-b * t)
+    G = -math.expm1(-b * t)
+    D = 1 + beta * E
+    K = 1 - alpha / beta
+    P = G * K + alpha * t
+    return (
+        a * P / D,
+        (
+            P / D,
+            a * t * E * (K * D + beta * P) / (D * D),
+            a * (t - G / beta) / D,
+            a * (alpha * G * D / (beta * beta) - P * E) / (D * D),
+        ),
+    )
+
+def _linear_basis(ts, b, beta):
+    """Columns u = G/D and v = (t - G/beta)/D, so that m = a*u + (a*alpha)*v."""
+    us, vs = [], []
+    for t in ts:
+        E = math.exp(-b * t)
+        G = -math.expm1(-b * t)
+        D = 1 + beta * E
+        us.append(G / D)
+        vs.append((t - G / beta) / D)
+    return us, vs
+
+def _dot(x, y):
+    return sum(map(operator.mul, x, y))
+
+def _linear_part(us, vs, ys):
+    """
+    Least-squares (a, alpha) for the basis (u, v), with a > 0 and alpha >= 0.
+    Also returns the active basis (v is dropped when alpha sits at 0).
+    """
+    suu, suv, svv = _dot(us, us), _dot(us, vs), _dot(vs, vs)
+    suy, svy = _dot(us, ys), _dot(vs, ys)
+    det = suu * svv - suv * suv
+    if det > 0:
+        a = (suy * svv - svy * suv) / det
+        c = (svy * suu - suy * suv) / det
+        if c >= 0 and a > 0:
+            return a, c / a, (us, vs)
+    # alpha at its bound: perfect debugging, only a is free
+    a = suy / suu if suu > 0 else 0.0
+    return (a, 0.0, (us,)) if a > 0 else (None, None, None)
+
+def _project_out(column, basis):
+    """Removes from 'column' its least-squares component in span(basis)."""
+    if len(basis) == 1:
+        (u,) = basis
+        k = _dot(u, column) / _dot(u, u)
+        return [x - k * ui for x, ui in zip(column, u)]
+    u, v = basis
+    suu, suv, svv = _dot(u, u), _dot(u, v), _dot(v, v)
+    su, sv = _dot(u, column), _dot(v, column)
+    det = suu * svv - suv * suv
+    ku = (su * svv - sv * suv) / det
+    kv = (sv * suu - su * suv) / det
+    return [x - ku * ui - kv * vi for x, ui, vi in zip(column, u, v)]
+
+def _default_start(times, cumulative):
+    return 2.0 / max(max(times), 1e-9), 1.0
+
+def fit_pnz(times, cumulative_failures, initial=None, max_iter=200, tol=1e-10):
+    """
+    Least-squares fit of (a, b, alpha, beta) to cumulative failure counts
+    observed at 'times'. For weekly counts pass
+    itertools.accumulate(weekly_counts) as 'cumulative_failures'.
+
+    'initial' is a starting (a, b, alpha, beta), e.g. the fit of a similar
+    service; only its b and beta are used since a and alpha are solved
+    exactly. Without it a rough guess is derived from the data.
+
+    Returns a PNZFit including goodness of fit (SSE, R^2, and the least-squares
+    AIC/BIC n*ln(SSE/n) + penalty) for comparison against other models.
+    """
+    ts = [float(t) for t in times]
+    ys = [float(y) for y in cumulative_failures]
+    n = len(ts)
+    if n != len(ys) or n <= PNZ_PARAMETER_COUNT:
+        raise ValueError(f"Need more than {PNZ_PARAMETER_COUNT} (time, count) pairs of equal length")
+    if initial is not None and initial[1] > 0 and initial[3] > 0:
+        b, beta = float(initial[1]), float(initial[3])
+    else:
+        b, beta = _default_start(ts, ys)
+
+    def evaluate(b, beta):
+        us, vs = _linear_basis(ts, b, beta)
+        a, alpha, basis = _linear_part(us, vs, ys)
+        if a is None:
+            return None
+        rows = [_pnz_jacobian_row(t, a, b, alpha, beta) for t in ts]
+        residuals = [m - y for (m, _), y in zip(rows, ys)]
+        # Kaufman's variable-projection Jacobian: the dm/db and dm/dbeta
+        # columns with their component along the linear basis removed,
+        # since a and alpha re-adjust along those directions anyway.
+        col_b = _project_out([grad[1] for _, grad in rows], basis)
+        col_beta = _project_out([grad[3] for _, grad in rows], basis)
+        jac = list(zip(col_b, col_beta))
+        return (a, b, alpha, beta), jac, residuals, sum(r * r for r in residuals)
+
+    state = evaluate(b, beta)
+    if state is None:
+        raise ValueError("Could not find a positive starting point for the fit")
+    params, jac, residuals, sse = state
+    damping = 1e-3
+    converged = False
+    iteration = 0
+    for iteration in range(1, max_iter + 1):
+        j11 = sum(r[0] * r[0] for r in jac)
+        j12 = sum(r[0] * r[1] for r in jac)
+        j22 = sum(r[1] * r[1] for r in jac)
+        g1 = sum(r[0] * e for r, e in zip(jac, residuals))
+        g2 = sum(r[1] * e for r, e in zip(jac, residuals))
+
+        candidate = None
+        while damping < 1e12:
+            # (J^T J + damping * diag(J^T J)) step = -J^T r
+            a11, a22 = j11 * (1 + damping), j22 * (1 + damping)
+            det = a11 * a22 - j12 * j12
+            if det > 0:
+                step_b = (-g1 * a22 + g2 * j12) / det
+                step_beta = (-g2 * a11 + g1 * j12) / det
+                new_b, new_beta = params[1] + step_b, params[3] + step_beta
+                if new_b > 0 and new_beta > 0:
+                    candidate = evaluate(new_b, new_beta)
+                    if candidate is not None and candidate[3] < sse:
+                        break
+            candidate = None
+            damping *= 10
+
+        if candidate is None:
+            converged = True  # no downhill step left: at a (local) minimum
+            break
+        relative_change = (sse - candidate[3]) / max(sse, 1e-300)
+        params, jac, residuals, sse = candidate
+        damping = max(damping / 10, 1e-12)
+        if relative_change < tol:
+            converged = True
+            break
+
+    mean_y = sum(ys) / n
+    total = sum((y - mean_y) ** 2 for y in ys)
+    r_squared = 1 - sse / total if total > 0 else math.nan
+    log_term = n * math.log(sse / n) if sse > 0 else -math.inf
+    aic = log_term + 2 * PNZ_PARAMETER_COUNT
+    bic = log_term + PNZ_PARAMETER_COUNT * math.log(n)
+    return PNZFit(*params, sse, r_squared, aic, bic, n, iteration, converged)
+
+def _fit_block(datasets, initial, max_iter, tol):
+    """
+    Fits datasets in order, warm-starting each from the previous converged
+    fit. A dataset that cannot be fitted gives None and is not a warm start.
+    """
+    fits = []
+    start = initial
+    for times, cumulative in datasets:
+        try:
+            fit = fit_pnz(times, cumulative, start, max_iter, tol)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            fits.append(None)
+            continue
+        fits.append(fit)
+        if fit.converged:
+            start = fit[:PNZ_PARAMETER_COUNT]
+    return fits
+
+def fit_pnz_many(datasets, initial=None, processes=None, block_size=64,
+                 max_iter=200, tol=1e-10):
+    """
+    Fits many independent (times, cumulative_failures) datasets.
+
+    Datasets are split into contiguous blocks of 'block_size' that run in
+    parallel on a process pool ('processes' workers, default: all cores;
+    processes=1 runs inline). Inside a block each fit is warm-started from
+    the previous dataset's solution, so order neighbouring (similar)
+    services next to each other.
+
+    Returns the PNZFit results in input order, with None for every dataset
+    that could not be fitted (too few points, no positive starting point).
+    """
+    datasets = [(list(t), list(y)) for t, y in datasets]
+    blocks = [datasets[i:i + block_size] for i in range(0, len(datasets), block_size)]
+    return map_chunks(_fit_block, blocks, (initial, max_iter, tol), processes)
 
-def run_simulation():
+def run_simulation(clock=time):
     print("=========================================")
     print("   PNZ RELIABILITY MODEL SIMULATION      ")
     print("=========================================")
@@ -73,7 +494,7 @@ def run_simulation():
         bar = "█" * int(growth * 2) 
         
         print(f"{t:<10} | {m_t:<25.2f} | {bar}")
-        time.sleep(0.2)
+        clock.sleep(0.2)
 
     print("-" * 40)
     print("\nAnalysis:")
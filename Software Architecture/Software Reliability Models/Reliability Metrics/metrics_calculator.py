@@ -6,37 +6,359 @@ This script calculates MTBF, MTTF, MTTR, and Availability from raw system logs.
 Scenario: A server that crashes and gets rebooted multiple times.
 """
 
-def calculate_metrics(incidents):
+import math
+import mmap
+import operator
+import os
+from array import array
+from collections import deque
+
+class MetricsAccumulator:
+    """
+    Incremental reliability metrics with O(1) state.
+
+    Incidents can be added one at a time (add) or in batches (add_many);
+    the metrics are available at any moment. Accumulators built on separate
+    shards of a log can be combined with merge() or '+'.
+    """
+
+    __slots__ = ("failures", "total_uptime", "total_downtime")
+
+    def __init__(self, failures=0, total_uptime=0.0, total_downtime=0.0):
+        self.failures = failures
+        self.total_uptime = total_uptime
+        self.total_downtime = total_downtime
+
+    def add(self, start, fail, end):
+        self.failures += 1
+        self.total_uptime += fail - start
+        self.total_downtime += end - fail
+        return self
+
+    def add_many(self, incidents):
+        uptime = downtime = 0.0
+        count = 0
+        for start, fail, end in incidents:
+            uptime += fail - start
+            downtime += end - fail
+            count += 1
+        self.failures += count
+        self.total_uptime += uptime
+        self.total_downtime += downtime
+        return self
+
+    def merge(self, other):
+        self.failures += other.failures
+        self.total_uptime += other.total_uptime
+        self.total_downtime += other.total_downtime
+        return self
+
+    def __add__(self, other):
+        return MetricsAccumulator(self.failures, self.total_uptime,
+                                  self.total_downtime).merge(other)
+
+    @property
+    def mttf(self):
+        return self.total_uptime / self.failures if self.failures else math.nan
+
+    @property
+    def mttr(self):
+        return self.total_downtime / self.failures if self.failures else math.nan
+
+    @property
+    def mtbf(self):
+        return self.mttf + self.mttr
+
+    @property
+    def availability(self):
+        """Percentage of time the system was up (nan before the first incident)."""
+        cycle = self.total_uptime + self.total_downtime
+        return self.total_uptime / cycle * 100 if cycle else math.nan
+
+    def metrics(self):
+        """Returns (mttf, mttr, mtbf, availability), like calculate_metrics."""
+        return self.mttf, self.mttr, self.mtbf, self.availability
+
+class IncidentTableReporter:
+    """Prints one row per incident; pass to calculate_metrics as 'reporter'."""
+
+    def __init__(self):
+        self.header_printed = False
+
+    def __call__(self, number, uptime, downtime):
+        if not self.header_printed:
+            print(f"\n{'-'*60}")
+            print(f"{'Incident':<10} | {'Uptime (hrs)':<15} | {'Downtime (hrs)':<15}")
+            print(f"{'-'*60}")
+            self.header_printed = True
+        print(f"{number:<10} | {uptime:<15.2f} | {downtime:<15.2f}")
+
+def calculate_metrics(incidents, reporter=None):
     """
     Incidents is a list of tuples: (start_time, failure_time, repair_end_time)
     start_time     : When system started running (or restarted)
     failure_time   : When system crashed
     repair_end_time: When system was fixed and running again
+
+    reporter: optional callable(number, uptime, downtime) invoked per incident
+              (e.g. IncidentTableReporter()). Without it no I/O is done.
     """
-    total_uptime = 0
-    total_downtime = 0
-    failures = len(incidents)
-    
-    print(f"\n{'-'*60}")
-    print(f"{'Incident':<10} | {'Uptime (hrs)':<15} | {'Downtime (hrs)':<15}")
-    print(f"{'-'*60}")
-    
-    for i, (start, fail, end) in enumerate(incidents):
-        uptime = fail - start
-        downtime = end - fail
-        
-        total_uptime += uptime
-        total_downtime += downtime
-        
-        print(f"{i+1:<10} | {uptime:<15.2f} | {downtime:<15.2f}")
-
-    # Calculations
-    mttf = total_uptime / failures
-    mttr = total_downtime / failures
-    mtbf = mttf + mttr
-    availability = mttf / mtbf * 100
-
-    return mttf, mttr, mtbf, availability
+    accumulator = MetricsAccumulator()
+    if reporter is None:
+        accumulator.add_many(incidents)
+    else:
+        for i, (start, fail, end) in enumerate(incidents):
+            accumulator.add(start, fail, end)
+            reporter(i + 1, fail - start, end - fail)
+
+    if accumulator.failures == 0:
+        raise ZeroDivisionError("No incidents to compute metrics from")
+    return accumulator.metrics()
+
+# ------------------------------------------------------------------------------
+# Rolling windows and time buckets over a live incident feed
+# ------------------------------------------------------------------------------
+# Incidents must arrive in time order (each start >= the previous repair
+# end). Only [start, fail) counts as uptime and [fail, end) as downtime,
+# exactly as in calculate_metrics; gaps between incidents are not observed.
+
+class WindowedMetrics:
+    """
+    Rolling metrics over the last W hours for several windows at once,
+    e.g. WindowedMetrics({"1h": 1, "24h": 24, "30d": 720}).
+
+    Every incident is stored with the running uptime/downtime totals before
+    it, so the uptime up to any instant is one lookup plus a partial overlap.
+    Each window keeps a pointer to its oldest relevant incident that only
+    moves forward; incidents older than the longest window are dropped. Both
+    updates and queries are therefore O(1) amortized, and incidents that
+    straddle a window edge are clipped exactly. Querying a window at an
+    earlier 'now' than before restarts its pointer from the oldest incident
+    kept, which costs one rescan.
+    """
+
+    def __init__(self, windows):
+        if not isinstance(windows, dict):
+            windows = {length: length for length in windows}
+        if not windows or min(windows.values()) <= 0:
+            raise ValueError("At least one positive window length is required")
+        self.windows = dict(windows)
+        self.longest = max(self.windows.values())
+        self._incidents = deque()  # (start, fail, end, uptime_before, downtime_before)
+        self._dropped = 0          # absolute index of self._incidents[0]
+        self._pointers = {name: 0 for name in self.windows}
+        self._last_now = {name: -math.inf for name in self.windows}
+        self.failures = 0
+        self.total_uptime = 0.0
+        self.total_downtime = 0.0
+        self.latest = -math.inf
+
+    def add(self, start, fail, end):
+        if not start <= fail <= end:
+            raise ValueError(f"Invalid incident ({start}, {fail}, {end})")
+        if start < self.latest:
+            raise ValueError("Incidents must be added in time order")
+        self._incidents.append((start, fail, end, self.total_uptime, self.total_downtime))
+        self.failures += 1
+        self.total_uptime += fail - start
+        self.total_downtime += end - fail
+        self.latest = end
+        self._evict(end - self.longest)
+        return self
+
+    def add_many(self, incidents):
+        for start, fail, end in incidents:
+            self.add(start, fail, end)
+        return self
+
+    def _evict(self, horizon):
+        incidents = self._incidents
+        while len(incidents) > 1 and incidents[0][2] <= horizon:
+            incidents.popleft()
+            self._dropped += 1
+
+    def _first_ending_after(self, name, instant):
+        """Absolute index of the first incident with end > instant."""
+        index = max(self._pointers[name], self._dropped)
+        last = self._dropped + len(self._incidents)
+        while index < last and self._incidents[index - self._dropped][2] <= instant:
+            index += 1
+        self._pointers[name] = index
+        return index
+
+    def _totals_at(self, index, instant):
+        """(uptime, downtime) accumulated up to 'instant', which lies before
+        the end of incident 'index' (or after every incident)."""
+        if index == self._dropped + len(self._incidents):
+            return self.total_uptime, self.total_downtime
+        start, fail, end, up, down = self._incidents[index - self._dropped]
+        up += min(max(instant - start, 0.0), fail - start)
+        down += min(max(instant - fail, 0.0), end - fail)
+        return up, down
+
+    def window(self, name, now=None):
+        """
+        Returns (mttf, mttr, mtbf, availability) over the window (now - W, now].
+        'now' defaults to the latest repair end; it may not lie before it
+        (older incidents may already be dropped).
+
+        MTTF = uptime in the window / failures in the window,
+        MTTR = mean duration of repairs completed in the window.
+        """
+        now = self.latest if now is None else now
+        if now < self.latest:
+            raise ValueError(f"'now' ({now}) lies before the latest repair end ({self.latest})")
+        if now < self._last_now[name]:
+            self._pointers[name] = self._dropped  # the edge moved back: rescan
+        self._last_now[name] = now
+        edge = now - self.windows[name]
+        index = self._first_ending_after(name, edge)
+        last = self._dropped + len(self._incidents)
+
+        up_now, down_now = self.total_uptime, self.total_downtime
+        up_edge, down_edge = self._totals_at(index, edge)
+        uptime, downtime = up_now - up_edge, down_now - down_edge
+
+        repairs = last - index
+        if index < last:
+            repair_time = self.total_downtime - self._incidents[index - self._dropped][4]
+        else:
+            repair_time = 0.0
+        failures = repairs
+        if index < last and self._incidents[index - self._dropped][1] <= edge:
+            failures -= 1
+        mttf = uptime / failures if failures else math.nan
+        mttr = repair_time / repairs if repairs else math.nan
+        cycle = uptime + downtime
+        availability = uptime / cycle * 100 if cycle else math.nan
+        return mttf, mttr, mttf + mttr, availability
+
+    def snapshot(self, now=None):
+        """Metrics for every window: {name: (mttf, mttr, mtbf, availability)}."""
+        return {name: self.window(name, now) for name in self.windows}
+
+def bucketed_availability(incidents, bucket_width, origin=0.0):
+    """
+    Yields (bucket_start, availability %) for consecutive fixed-width buckets
+    starting at 'origin'. Uptime and downtime that straddle a bucket boundary
+    are split between the buckets. Buckets with no observed time are skipped.
+    Incidents must be in time order; each bucket is yielded as soon as no
+    later incident can touch it.
+    """
+    open_buckets = {}  # bucket index -> [uptime, downtime]
+
+    def spread(begin, finish, slot):
+        while begin < finish:
+            index = math.floor((begin - origin) / bucket_width)
+            boundary = min(origin + (index + 1) * bucket_width, finish)
+            open_buckets.setdefault(index, [0.0, 0.0])[slot] += boundary - begin
+            begin = boundary
+
+    def flush(before):
+        for index in sorted(k for k in open_buckets if k < before):
+            up, down = open_buckets.pop(index)
+            if up + down > 0:
+                yield origin + index * bucket_width, up / (up + down) * 100
+
+    for start, fail, end in incidents:
+        yield from flush(math.floor((start - origin) / bucket_width))
+        spread(start, fail, 0)
+        spread(fail, end, 1)
+    yield from flush(math.inf)
+
+# ------------------------------------------------------------------------------
+# Columnar incident store
+# ------------------------------------------------------------------------------
+# A store is a directory holding three append-only files of raw native-endian
+# float64 values (8 bytes per incident per column, no per-record overhead):
+#     start.f64   fail.f64   end.f64
+# Row k of the log is (start[k], fail[k], end[k]). Reading goes through mmap,
+# so the OS pages data in and out and memory use stays flat.
+
+INCIDENT_COLUMNS = ("start", "fail", "end")
+
+class IncidentColumnStore:
+    """
+    Append-only columnar incident log.
+
+        with IncidentColumnStore("incidents.cols") as store:
+            store.append_many(logs)
+        mttf, mttr, mtbf, avail = calculate_metrics_columnar("incidents.cols")
+    """
+
+    def __init__(self, path, buffer_size=65536):
+        self.path = path
+        self.buffer_size = buffer_size
+        os.makedirs(path, exist_ok=True)
+        self._buffers = [array("d") for _ in INCIDENT_COLUMNS]
+        self._files = [open(self._column_path(name), "ab") for name in INCIDENT_COLUMNS]
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.f64")
+
+    def append(self, start, fail, end):
+        for buffer, value in zip(self._buffers, (start, fail, end)):
+            buffer.append(value)
+        if len(self._buffers[0]) >= self.buffer_size:
+            self.flush()
+
+    def append_many(self, incidents):
+        for start, fail, end in incidents:
+            self.append(start, fail, end)
+
+    def flush(self):
+        for buffer, handle in zip(self._buffers, self._files):
+            buffer.tofile(handle)
+            del buffer[:]
+            handle.flush()
+
+    def close(self):
+        if self._files:
+            self.flush()
+            for handle in self._files:
+                handle.close()
+            self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _column_sizes(path):
+    sizes = [os.path.getsize(os.path.join(path, f"{name}.f64")) for name in INCIDENT_COLUMNS]
+    itemsize = array("d").itemsize
+    if len(set(sizes)) != 1 or sizes[0] % itemsize:
+        raise ValueError(f"Corrupt incident store at {path!r}: column sizes {sizes}")
+    return sizes[0] // itemsize
+
+def calculate_metrics_columnar(path):
+    """
+    calculate_metrics for an IncidentColumnStore directory.
+
+    The columns are read straight from their mmaps through float64
+    memoryviews; uptime and downtime are summed as fsum(fail - start) and
+    fsum(end - fail) element-wise, so no record objects are built and the
+    totals stay exact even for large absolute timestamps.
+    """
+    failures = _column_sizes(path)
+    if failures == 0:
+        raise ZeroDivisionError("No incidents to compute metrics from")
+
+    handles = [open(os.path.join(path, f"{name}.f64"), "rb") for name in INCIDENT_COLUMNS]
+    maps = [mmap.mmap(h.fileno(), 0, access=mmap.ACCESS_READ) for h in handles]
+    views = [memoryview(m).cast("d") for m in maps]
+    try:
+        start, fail, end = views
+        total_uptime = math.fsum(map(operator.sub, fail, start))
+        total_downtime = math.fsum(map(operator.sub, end, fail))
+    finally:
+        for view in views:
+            view.release()
+        for resource in maps + handles:
+            resource.close()
+
+    return MetricsAccumulator(failures, total_uptime, total_downtime).metrics()
 
 def run_simulation():
     print("=========================================")
@@ -52,7 +374,7 @@ def run_simulation():
         (301.0, 600.0, 604.0), # Ran for 299h, took 4h to fix
     ]
     
-    mttf, mttr, mtbf, avail = calculate_metrics(logs)
+    mttf, mttr, mtbf, avail = calculate_metrics(logs, reporter=IncidentTableReporter())
     
     print(f"{'-'*60}")
     print("\n📊 RESULTS:")
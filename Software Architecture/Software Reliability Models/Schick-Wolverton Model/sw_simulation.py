@@ -10,6 +10,7 @@ so the Reliability curve should drop SLOWER (meaning the system is more reliable
 
 import math
 import time
+from array import array
 
 def sw_reliability(t, N, phi, i):
     """
@@ -23,7 +24,71 @@ def sw_reliability(t, N, phi, i):
     exponent = -phi * remaining_faults * (t**2 / 2)
     return math.exp(exponent)
 
-def run_simulation():
+# ------------------------------------------------------------------------------
+# Reliability surface: R(t) for every interval i = 1..N at once
+# ------------------------------------------------------------------------------
+# Row i of the surface is R_i(t) = exp(-(N - (i-1)) * h(t)) with
+# h(t) = phi * t^2 / 2, so h is computed once per time point and every row
+# is a single pass over it. Rows are stored as array.array buffers:
+# typecode 'd' (float64) or 'f' (float32, half the memory).
+
+class SWReliabilitySurface:
+    """
+    Lazy N x T reliability matrix. Rows are only computed when accessed,
+    so a 10^4 x 10^5 surface can be streamed row by row or in slices
+    without ever holding the whole matrix in memory.
+
+    Indexing is 0-based like a list (surface[0] is interval 1);
+    row(i) uses the 1-based interval number of sw_reliability.
+    """
+
+    def __init__(self, t, N, phi, typecode="d"):
+        if typecode not in ("d", "f"):
+            raise ValueError("typecode must be 'd' (float64) or 'f' (float32)")
+        self.N = N
+        self.phi = phi
+        self.typecode = typecode
+        self.times = array("d", t)
+        self._hazard = [phi * x * x / 2 for x in self.times]
+
+    def __len__(self):
+        return self.N
+
+    def row(self, i):
+        """R(t) over the whole time grid for interval i (1-based)."""
+        if not 1 <= i <= self.N:
+            raise IndexError(f"interval {i} outside 1..{self.N}")
+        remaining = self.N - (i - 1)
+        exp = math.exp
+        return array(self.typecode, [exp(-remaining * h) for h in self._hazard])
+
+    def rows(self, start=1, stop=None):
+        """Yields the rows for intervals start..stop (inclusive, 1-based)."""
+        stop = self.N if stop is None else stop
+        for i in range(start, stop + 1):
+            yield self.row(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(k + 1) for k in range(*index.indices(self.N))]
+        if index < 0:
+            index += self.N
+        return self.row(index + 1)
+
+    def __iter__(self):
+        return self.rows()
+
+    def to_matrix(self):
+        """Materialises the full N x T matrix as a list of rows."""
+        return list(self.rows())
+
+def sw_reliability_matrix(t, N, phi, typecode="d"):
+    """
+    Builds the full N x T matrix: row i-1 holds R(t) for interval i.
+    """
+    return SWReliabilitySurface(t, N, phi, typecode).to_matrix()
+
+def run_simulation(clock=time):
     print("=========================================")
     print("   SCHICK-WOLVERTON MODEL SIMULATION     ")
     print("=========================================")
@@ -45,14 +110,16 @@ def run_simulation():
     print("-" * 55)
     
     # Simulate time passing (0 to 10 hours)
-    for t in range(0, 11):
+    surface = SWReliabilitySurface(range(0, 11), N, phi)
+    curves = [surface.row(i) for i in intervals_to_test]
+    for k, t in enumerate(range(0, 11)):
         row = f"{t:<10}"
-        for i in intervals_to_test:
-            r_t = sw_reliability(t, N, phi, i)
+        for curve in curves:
+            r_t = curve[k]
             # Visualize with percentage
             row += f" | {r_t*100:6.2f}%      "
         print(row)
-        time.sleep(0.2)
+        clock.sleep(0.2)
         
     print("-" * 55)
     print("\nObservation:")
@@ -0,0 +1,200 @@
+"""
+Reliability Benchmark Suite
+===========================
+This script times the evaluators and fitters of this folder at growing input
+sizes, comparing the original one-value-per-call functions with their batch
+counterparts, and stores the results as JSON so that runs of different
+versions can be compared.
+
+    python benchmark.py                              # 10^3 .. 10^7, writes benchmark_results.json
+    python benchmark.py --max-size 100000 --quiet
+    python benchmark.py --baseline old.json          # exit code 1 on regressions
+
+Measurements run headless: time.sleep is replaced by a no-op and stdout is
+discarded while a case is being timed.
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import model_registry
+from sim_loader import load_script
+
+go = model_registry.go_simulation
+jm = model_registry.jm_simulation
+sw = model_registry.sw_simulation
+pnz = model_registry.pnz_simulation
+metrics = load_script("metrics_calculator", "Reliability Metrics/metrics_calculator.py",
+                      os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+@contextlib.contextmanager
+def headless():
+    """Disables time.sleep and printing for the duration of the block."""
+    real_sleep = time.sleep
+    time.sleep = lambda seconds: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        time.sleep = real_sleep
+
+# ==============================================================================
+# Cases
+# ==============================================================================
+# Each case maps a size n to a zero-argument callable doing n units of work.
+# Anything that is not part of the measured work (e.g. writing the columnar
+# store) happens in the factory, before the clock starts.
+
+def _grid(n):
+    return range(n)
+
+def _incidents(n):
+    """n incident tuples without holding n tuples in memory."""
+    cycle = [(10.0 * k, 10.0 * k + 9.0, 10.0 * k + 10.0) for k in range(1000)]
+    return itertools.islice(itertools.cycle(cycle), n)
+
+def _columnar_store(n, directory):
+    path = os.path.join(directory, f"incidents_{n}.cols")
+    with metrics.IncidentColumnStore(path) as store:
+        store.append_many(_incidents(n))
+    return path
+
+def build_cases(workdir):
+    return [
+        ("goel_okumoto_mean", "scalar",
+         lambda n: lambda: [go.goel_okumoto_mean(t, 150.0, 0.1) for t in _grid(n)]),
+        ("goel_okumoto_mean", "batch",
+         lambda n: lambda: go.goel_okumoto_curve(_grid(n), 150.0, 0.1)),
+
+        ("pnz_mean_value_function", "scalar",
+         lambda n: lambda: [pnz.pnz_mean_value_function(t, 100, 0.15, 0.5, 5.0) for t in _grid(n)]),
+        ("pnz_mean_value_function", "batch",
+         lambda n: lambda: pnz.pnz_mean_curve(_grid(n), 100, 0.15, 0.5, 5.0)),
+
+        ("sw_reliability", "scalar",
+         lambda n: lambda: [sw.sw_reliability(t, 50, 0.001, 25) for t in _grid(n)]),
+        ("sw_reliability", "batch",
+         lambda n: lambda: sw.SWReliabilitySurface(_grid(n), 50, 0.001).row(25)),
+
+        ("simulate_failure_time", "scalar",
+         lambda n: lambda: [jm.simulate_failure_time(0.5) for _ in range(n)]),
+        ("simulate_failure_time", "batch",
+         lambda n: lambda: sum(len(chunk) for chunk in
+                               jm.iter_failure_history_chunks(100, 0.01, max(n // 100, 1),
+                                                              rng=random.Random(1)))),
+
+        ("calculate_metrics", "scalar",
+         lambda n: lambda: metrics.calculate_metrics(_incidents(n))),
+        ("calculate_metrics", "accumulator",
+         lambda n: lambda: metrics.MetricsAccumulator().add_many(_incidents(n)).metrics()),
+        ("calculate_metrics", "columnar",
+         lambda n: (lambda path: lambda: metrics.calculate_metrics_columnar(path))(
+             _columnar_store(n, workdir))),
+    ]
+
+# ==============================================================================
+# Runner
+# ==============================================================================
+def measure(factory, size, repeat):
+    """Best wall-clock time of 'repeat' runs, in seconds."""
+    with headless():
+        work = factory(size)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            work()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=3, only=None):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for function, path, factory in build_cases(workdir):
+            if only and function not in only:
+                continue
+            for size in sizes:
+                seconds = measure(factory, size, repeat)
+                results.append({
+                    "function": function,
+                    "path": path,
+                    "size": size,
+                    "seconds": seconds,
+                    "ns_per_item": seconds / size * 1e9,
+                })
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(report, baseline, threshold):
+    """Adds baseline timings and ratios; returns the regressed entries."""
+    previous = {(r["function"], r["path"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["function"], result["path"], result["size"]))
+        if old is None:
+            continue
+        result["baseline_seconds"] = old
+        result["ratio"] = result["seconds"] / old if old else float("inf")
+        if result["ratio"] > threshold:
+            regressions.append(result)
+    return regressions
+
+def print_report(report):
+    print(f"{'Function':<25} | {'Path':<12} | {'Size':>10} | {'Seconds':>10} | {'ns/item':>9} | {'vs base':>8}")
+    print("-" * 88)
+    for r in report["results"]:
+        ratio = f"{r['ratio']:.2f}x" if "ratio" in r else "-"
+        print(f"{r['function']:<25} | {r['path']:<12} | {r['size']:>10} | "
+              f"{r['seconds']:>10.4f} | {r['ns_per_item']:>9.1f} | {ratio:>8}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=lambda s: [int(float(x)) for x in s.split(",")],
+                        default=DEFAULT_SIZES, help="comma-separated sizes, e.g. 1e3,1e5")
+    parser.add_argument("--max-size", type=float, default=None, help="drop sizes above this")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", action="append", help="benchmark only this function (repeatable)")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown ratio counted as a regression (default 1.2)")
+    parser.add_argument("--quiet", action="store_true", help="do not print the summary table")
+    args = parser.parse_args(argv)
+
+    sizes = [s for s in args.sizes if args.max_size is None or s <= args.max_size]
+    report = run_benchmarks(sizes, args.repeat, args.only)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(report, json.load(handle), args.threshold)
+        report["regressions"] = len(regressions)
+
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+
+    if not args.quiet:
+        print_report(report)
+        print(f"\nResults written to {args.output}")
+        for r in regressions:
+            print(f"REGRESSION: {r['function']} [{r['path']}] n={r['size']}: {r['ratio']:.2f}x slower")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Reliability Model Registry
+==========================
+This script puts the four growth models of this folder (G-O, J-M, S-W and
+PNZ) behind one interface, so every model can be fitted to the same failure
+data and the best one picked by AIC or BIC.
+
+A dataset is a list of cumulative failure times. It is wrapped in a
+FailureData object that computes each sufficient statistic once, on first
+use, and shares it between all models:
+
+    G-O : n, sum(t_i), t_n
+    J-M : n, S = sum(x_i), W = sum((i-1) x_i)         (x_i = inter-failure times)
+    S-W : the same sums over x_i^2 / 2, plus sum(ln x_i)
+    PNZ : the cumulative failure curve sampled on a fixed grid
+
+All log-likelihoods are densities of the same observation (the failure
+times t_1..t_n, observed up to the last failure), so their AIC/BIC values
+can be compared directly.
+"""
+
+import math
+import os
+import sys
+from bisect import bisect_right
+from collections import namedtuple
+from functools import cached_property
+from itertools import accumulate
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ROOT = os.path.dirname(os.path.dirname(_HERE))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_loader import load_script
+from sim_parallel import map_chunks
+
+go_simulation = load_script("go_simulation", "Goel-Okumoto Model/go_simulation.py", _HERE)
+jm_simulation = load_script("jm_simulation", "Jelinski-Moranda Model/jm_simulation.py", _HERE)
+sw_simulation = load_script("sw_simulation", "Schick-Wolverton Model/sw_simulation.py", _HERE)
+pnz_simulation = load_script("pnz_simulation", "PNZ Model/pnz_simulation.py", _HERE)
+
+# ==============================================================================
+# Shared data
+# ==============================================================================
+class FailureData:
+    """Cumulative failure times plus lazily computed, cached statistics."""
+
+    def __init__(self, failure_times, pnz_points=50):
+        self.times = sorted(float(t) for t in failure_times)
+        if not self.times or self.times[0] < 0:
+            raise ValueError("Failure times must be a non-empty list of values >= 0")
+        self.pnz_points = pnz_points
+
+    @classmethod
+    def from_intervals(cls, intervals, **kwargs):
+        return cls(accumulate(intervals), **kwargs)
+
+    @cached_property
+    def n(self):
+        return len(self.times)
+
+    @cached_property
+    def total_time(self):
+        return math.fsum(self.times)
+
+    @cached_property
+    def last_time(self):
+        return self.times[-1]
+
+    @cached_property
+    def intervals(self):
+        return [t - s for s, t in zip([0.0] + self.times[:-1], self.times)]
+
+    @cached_property
+    def interval_statistics(self):
+        """(n, S, W) of the J-M likelihood; W = n * t_n - sum(t_i)."""
+        return self.n, self.last_time, self.n * self.last_time - self.total_time
+
+    @cached_property
+    def squared_interval_statistics(self):
+        """(n, Q, V): the J-M statistics with x_i replaced by x_i^2 / 2."""
+        halves = [x * x / 2 for x in self.intervals]
+        Q = math.fsum(halves)
+        V = math.fsum(i * h for i, h in enumerate(halves))
+        return self.n, Q, V
+
+    @cached_property
+    def log_interval_sum(self):
+        return math.fsum(math.log(x) if x > 0 else -math.inf for x in self.intervals)
+
+    @cached_property
+    def cumulative_curve(self):
+        """(grid, counts): failures observed by each of pnz_points grid times."""
+        points = min(self.pnz_points, self.n)
+        grid = [self.last_time * (k + 1) / points for k in range(points)]
+        return grid, [bisect_right(self.times, t) for t in grid]
+
+# ==============================================================================
+# Models
+# ==============================================================================
+ModelScore = namedtuple("ModelScore", "model params log_likelihood aic bic error")
+
+MODEL_REGISTRY = {}
+
+def register_model(model_class):
+    """Class decorator adding a model to MODEL_REGISTRY under its 'name'."""
+    MODEL_REGISTRY[model_class.name] = model_class()
+    return model_class
+
+class ReliabilityModel:
+    """
+    Common interface. Subclasses set 'name' and 'parameter_count' and
+    implement fit(data) -> (params dict, log-likelihood).
+    """
+    name = None
+    parameter_count = 0
+
+    def fit(self, data):
+        raise NotImplementedError
+
+    def score(self, data):
+        try:
+            params, log_likelihood = self.fit(data)
+        except (ValueError, ZeroDivisionError, OverflowError) as error:
+            return ModelScore(self.name, None, -math.inf, math.inf, math.inf, str(error))
+        k = self.parameter_count
+        aic = 2 * k - 2 * log_likelihood
+        bic = k * math.log(data.n) - 2 * log_likelihood
+        return ModelScore(self.name, params, log_likelihood, aic, bic, None)
+
+@register_model
+class GoelOkumotoModel(ReliabilityModel):
+    name = "G-O"
+    parameter_count = 2
+
+    def fit(self, data):
+        fit = go_simulation.fit_goel_okumoto_statistics(data.n, data.total_time, data.last_time)
+        return {"a": fit.a, "b": fit.b}, fit.log_likelihood
+
+@register_model
+class JelinskiMorandaModel(ReliabilityModel):
+    name = "J-M"
+    parameter_count = 2
+
+    def fit(self, data):
+        fit = jm_simulation.fit_jelinski_moranda_statistics(*data.interval_statistics)
+        return {"N": fit.N, "phi": fit.phi}, fit.log_likelihood
+
+@register_model
+class SchickWolvertonModel(ReliabilityModel):
+    """
+    The S-W density phi*(N-i+1)*x*exp(-phi*(N-i+1)*x^2/2) is the J-M density
+    in x^2/2 times x, so the J-M solver is reused on the squared statistics
+    and sum(ln x_i) is added to its log-likelihood.
+    """
+    name = "S-W"
+    parameter_count = 2
+
+    def fit(self, data):
+        fit = jm_simulation.fit_jelinski_moranda_statistics(*data.squared_interval_statistics)
+        return {"N": fit.N, "phi": fit.phi}, fit.log_likelihood + data.log_interval_sum
+
+@register_model
+class PNZModel(ReliabilityModel):
+    """
+    Fitted by least squares on the cumulative curve (fit_pnz), then scored
+    with the NHPP likelihood sum(ln lambda(t_i)) - m(t_n) at those estimates.
+    """
+    name = "PNZ"
+    parameter_count = 4
+
+    def fit(self, data):
+        grid, counts = data.cumulative_curve
+        fit = pnz_simulation.fit_pnz(grid, counts)
+        theta = (fit.a, fit.b, fit.alpha, fit.beta)
+        log_likelihood = -pnz_simulation.pnz_mean_value_function(data.last_time, *theta)
+        for t in data.times:
+            rate = pnz_simulation.pnz_intensity(t, *theta)
+            if rate <= 0:
+                raise ValueError("PNZ fit has a non-positive intensity at an observed failure")
+            log_likelihood += math.log(rate)
+        return {"a": fit.a, "b": fit.b, "alpha": fit.alpha, "beta": fit.beta}, log_likelihood
+
+# ==============================================================================
+# Batch model selection
+# ==============================================================================
+def score_models(data, models=None):
+    """Fits every model (default: all registered) to one dataset."""
+    if not isinstance(data, FailureData):
+        data = FailureData(data)
+    names = MODEL_REGISTRY if models is None else models
+    return [MODEL_REGISTRY[name].score(data) for name in names]
+
+def _select_chunk(datasets, models, criterion):
+    results = []
+    for times in datasets:
+        scores = score_models(times, models)
+        best = min(scores, key=lambda score: getattr(score, criterion))
+        results.append((best.model if best.error is None else None, scores))
+    return results
+
+def select_models(datasets, models=None, criterion="aic", processes=None, chunk_size=32):
+    """
+    Fits all models to every dataset and picks the best by 'criterion'
+    ("aic" or "bic"). Datasets are processed in chunks on a process pool
+    (processes=1 runs inline).
+
+    Returns, per dataset, (best model name or None, [ModelScore, ...]).
+    """
+    if criterion not in ("aic", "bic"):
+        raise ValueError("criterion must be 'aic' or 'bic'")
+    datasets = [list(times) for times in datasets]
+    chunks = [datasets[i:i + chunk_size] for i in range(0, len(datasets), chunk_size)]
+    return map_chunks(_select_chunk, chunks, (models, criterion), processes)
+
+def run_simulation():
+    print("=========================================")
+    print("   RELIABILITY MODEL SELECTION           ")
+    print("=========================================")
+
+    # Failure times (hours) of a system under test, with growing gaps
+    intervals = [3, 4, 2, 6, 5, 9, 7, 12, 10, 15, 14, 22, 19, 30, 28, 41, 39, 55]
+    data = FailureData.from_intervals(intervals)
+    print(f"Observed {data.n} failures over {data.last_time:.0f} hours.\n")
+
+    print(f"{'Model':<8} | {'Log-Lik':>10} | {'AIC':>10} | {'BIC':>10} | Parameters")
+    print("-" * 75)
+    scores = score_models(data)
+    for score in scores:
+        if score.error:
+            print(f"{score.model:<8} | {'(no fit)':>10} | {'-':>10} | {'-':>10} | {score.error}")
+            continue
+        params = ", ".join(f"{k}={v:.4g}" for k, v in score.params.items())
+        print(f"{score.model:<8} | {score.log_likelihood:>10.2f} | {score.aic:>10.2f} | "
+              f"{score.bic:>10.2f} | {params}")
+    print("-" * 75)
+    best = min(scores, key=lambda score: score.aic)
+    print(f"\nBest model by AIC: {best.model}")
+
+if __name__ == "__main__":
+    run_simulation()
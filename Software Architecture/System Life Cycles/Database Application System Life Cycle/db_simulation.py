@@ -12,8 +12,10 @@ import time
 import random
 
 class DatabaseProject:
-    def __init__(self, name):
+    def __init__(self, name, rng=random, clock=time):
         self.name = name
+        self.rng = rng
+        self.clock = clock
         self.phase = "Init"
         self.tables = []
         self.record_count = 0
@@ -21,7 +23,7 @@ class DatabaseProject:
 
     def log(self, message):
         print(f"[{self.phase.upper()}] {message}")
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
 
     def system_definition(self):
         self.phase = "Definition"
@@ -48,10 +50,10 @@ class DatabaseProject:
         self.log("Starting ETL Process from Legacy CSV files...")
         chunks = 5
         for i in range(chunks):
-            loaded = random.randint(1000, 5000)
+            loaded = self.rng.randint(1000, 5000)
             self.record_count += loaded
             print(f"   -> Loaded Chunk {i+1}/{chunks}: {loaded} records...")
-            time.sleep(0.3)
+            self.clock.sleep(0.3)
         self.log(f"Data Loading Compelte. Total Records: {self.record_count}")
 
     def app_conversion(self):
@@ -64,7 +66,7 @@ class DatabaseProject:
         self.log("Running Data Consistency Checks...")
         
         # Simulate a data error
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             self.log("⚠️ Found Orphaned Records in 'Orders' table.")
             self.log("   -> Fixing Integrity Constraints...")
         
@@ -75,7 +77,7 @@ class DatabaseProject:
         self.phase = "Operation"
         self.log("System Go-Live!")
         self.log("Parallel Run: Old System ✅ | New System ✅")
-        time.sleep(1)
+        self.clock.sleep(1)
         self.log("Cut-over complete. Old system decommissioned.")
 
     def maintenance(self):
@@ -84,7 +86,7 @@ class DatabaseProject:
         events = ["Index Fragmentation", "Disk Space Alert", "Slow Query", "New Requirement"]
         
         for _ in range(3):
-            event = random.choice(events)
+            event = self.rng.choice(events)
             self.log(f"Event Detected: {event}")
             if event == "Indexes":
                 print("   -> Re-building Indexes...")
@@ -92,14 +94,14 @@ class DatabaseProject:
                 print("   -> Feedback received. Initiating new Design Cycle...")
             else:
                 print("   -> Resolving issue...")
-            time.sleep(0.5)
+            self.clock.sleep(0.5)
 
-def run_simulation():
+def run_simulation(rng=random, clock=time):
     print("===========================================")
     print("   DATABASE LIFE CYCLE SIMULATION          ")
     print("===========================================")
     
-    db = DatabaseProject("ShopEasy DB")
+    db = DatabaseProject("ShopEasy DB", rng=rng, clock=clock)
     
     db.system_definition()
     db.database_design()
@@ -12,8 +12,10 @@ import time
 import random
 
 class InformationSystem:
-    def __init__(self, name, budget):
+    def __init__(self, name, budget, rng=random, clock=time):
         self.name = name
+        self.rng = rng
+        self.clock = clock
         self.budget = budget
         self.phase = "Concept"
         self.users = 0
@@ -23,7 +25,7 @@ class InformationSystem:
         
     def log(self, message):
         print(f"[{self.phase.upper()}] {message}")
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
 
     def feasibility_analysis(self):
         self.phase = "Feasibility"
@@ -56,7 +58,7 @@ class InformationSystem:
         self.phase = "Validation"
         self.log("Running Unit Tests...")
         self.log("Performing User Acceptance Testing (UAT) with Hospital Staff...")
-        bugs = random.randint(5, 15)
+        bugs = self.rng.randint(5, 15)
         self.log(f"Found {bugs} bugs. Fixing them...")
         self.health = 100
         print("✅ System Validated & Ready.")
@@ -80,11 +82,11 @@ class InformationSystem:
             self.years_active += 1
             
             # Growth
-            self.users += random.randint(50, 200)
-            self.data_size_gb += random.randint(10, 50)
+            self.users += self.rng.randint(50, 200)
+            self.data_size_gb += self.rng.randint(10, 50)
             
             # Wear and Tear
-            health_drop = random.randint(5, 15)
+            health_drop = self.rng.randint(5, 15)
             self.health -= health_drop
             
             print(f"Year {year}: Users: {self.users}, Data: {self.data_size_gb}GB, Health: {self.health}%")
@@ -99,7 +101,7 @@ class InformationSystem:
 
     def perform_maintenance(self):
         print("   -> 🔧 Maintenance Team deployed: Patching servers, optimizing queries...")
-        recovery = random.randint(10, 20)
+        recovery = self.rng.randint(10, 20)
         self.health = min(100, self.health + recovery)
         print(f"   -> System Health restored to {self.health}%")
 
@@ -112,12 +114,12 @@ class InformationSystem:
         self.log("Archiving data and Decommissioning servers.")
         print("🪦 System Retired.")
 
-def run_simulation():
+def run_simulation(rng=random, clock=time):
     print("==============================================")
     print("   INFORMATION SYSTEM LIFE CYCLE SIMULATION   ")
     print("==============================================")
     
-    hms = InformationSystem("City Hospital HMS", 150000)
+    hms = InformationSystem("City Hospital HMS", 150000, rng=rng, clock=clock)
     
     if hms.feasibility_analysis():
         hms.requirements_collection()
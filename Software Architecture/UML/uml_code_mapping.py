@@ -18,17 +18,18 @@ class BankSystem:
     """
     Represents the Backend Bank System (Component in Diagram)
     """
-    def __init__(self):
+    def __init__(self, clock=time):
+        self.clock = clock
         self._accounts = {"1234": {"pin": "0000", "balance": 1000}}
 
     def verify_card(self, card_num):
         print(f"   [BankSystem] Verifying Card {card_num}...")
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         return card_num in self._accounts
 
     def validate_pin(self, card_num, pin):
         print(f"   [BankSystem] Validating PIN...")
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         return self._accounts[card_num]["pin"] == pin
 
     def check_balance(self, card_num):
@@ -85,14 +86,14 @@ class ATM:
 # ==============================================================================
 # 2. SEQUENCE DIAGRAM SIMULATION (Runtime Behavior)
 # ==============================================================================
-def run_simulation():
+def run_simulation(clock=time):
     print("=========================================")
     print("   UML MODEL -> CODE MAPPING             ")
     print("=========================================")
     print("Demonstrating the 'ATM Withdrawal' Sequence Diagram\n")
 
     # Setup (structural wiring)
-    backend = BankSystem()
+    backend = BankSystem(clock)
     atm_machine = ATM(backend)
 
     # Execution (behavioral sequence)
@@ -2,6 +2,143 @@ import time
 import sys
 import os
 import random
+import heapq
+from collections import namedtuple
+from itertools import count
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_numeric import nearest_rank
+
+# (story, story points), most important first
+DEFAULT_BACKLOG = [
+    ("User Login", 3), ("Dark Mode", 2), ("Payment Gateway", 5),
+    ("Chat System", 5), ("Search Bar", 3), ("Notifications", 2)
+]
+
+# User feedback after each sprint (drawn uniformly) and the story points it
+# adds to the backlog
+FEEDBACK = [
+    "Great work! No changes needed.",
+    "Great work! No changes needed.",
+    "Bug found in payment! (Added to backlog)",
+    "We need a 'Share' button! (Added to backlog)"
+]
+BUG_POINTS = 2
+FEATURE_POINTS = 3
+
+def feedback_points(feedback):
+    if feedback.startswith("Bug"):
+        return BUG_POINTS
+    return FEATURE_POINTS if "Added to backlog" in feedback else 0
+
+class Backlog:
+    """
+    Product backlog as a heap of (priority, sequence, story) plus an index
+    story -> entry. Lower priority values come first; equal priorities keep
+    insertion order. add, reprioritize, remove and pop are O(log n):
+    replaced entries are only marked dead and skipped when they surface.
+    """
+
+    _DEAD = object()
+
+    def __init__(self, stories=()):
+        self._heap = []
+        self._index = {}
+        self._sequence = count()
+        self._dead = 0
+        self.points = 0
+        self.top = 0       # lowest priority value in use
+        self.bottom = -1   # highest priority value in use
+        for story, points in stories:
+            self.add(story, points)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, story):
+        return story in self._index
+
+    def __iter__(self):
+        """Stories in priority order (O(n log n); for display)."""
+        return (entry[2] for entry in sorted(self._index.values()))
+
+    def add(self, story, points=1, priority=None):
+        """Adds a story; priority=None puts it at the bottom."""
+        if story in self._index:
+            raise ValueError(f"'{story}' is already in the backlog")
+        if priority is None:
+            priority = self.bottom + 1
+        self.top = min(self.top, priority)
+        self.bottom = max(self.bottom, priority)
+        entry = [priority, next(self._sequence), story, points]
+        self._index[story] = entry
+        self.points += points
+        heapq.heappush(self._heap, entry)
+
+    def add_to_top(self, story, points=1):
+        self.add(story, points, self.top - 1)
+
+    def remove(self, story):
+        """Removes a story; returns its points."""
+        entry = self._index.pop(story)
+        entry[2] = self._DEAD
+        self.points -= entry[3]
+        self._dead += 1
+        if self._dead > len(self._heap) // 2:
+            self._compact()
+        return entry[3]
+
+    def reprioritize(self, story, priority):
+        points = self.remove(story)
+        self.add(story, points, priority)
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if entry[2] is not self._DEAD]
+        heapq.heapify(self._heap)
+        self._dead = 0
+
+    def _drop_dead(self):
+        heap = self._heap
+        while heap and heap[0][2] is self._DEAD:
+            heapq.heappop(heap)
+            self._dead -= 1
+
+    def peek(self):
+        """(story, points) of the most important story."""
+        self._drop_dead()
+        if not self._heap:
+            raise IndexError("peek from an empty backlog")
+        _, _, story, points = self._heap[0]
+        return story, points
+
+    def pop(self):
+        """Removes and returns (story, points) of the most important story."""
+        self._drop_dead()
+        if not self._heap:
+            raise IndexError("pop from an empty backlog")
+        _, _, story, points = heapq.heappop(self._heap)
+        del self._index[story]
+        self.points -= points
+        return story, points
+
+    def plan_sprint(self, capacity):
+        """
+        Takes stories in priority order while their points fit in 'capacity'.
+        A story bigger than the whole capacity is still taken when it comes
+        first, so it cannot block the backlog forever.
+        """
+        selected = []
+        remaining = capacity
+        while self._index:
+            story, points = self.peek()
+            if points > remaining and selected:
+                break
+            self.pop()
+            selected.append((story, points))
+            remaining -= points
+        return selected
 
 class AgileSprint:
     """
@@ -9,73 +146,249 @@ class AgileSprint:
     Demonstrates: Backlog Selection -> Development -> Deployment -> User Feedback.
     """
     
-    def __init__(self, name):
+    def __init__(self, name, rng=random, clock=time, headless=False, backlog=DEFAULT_BACKLOG,
+                 capacity=8):
         self.name = name
-        self.backlog = [
-            "User Login", "Dark Mode", "Payment Gateway", 
-            "Chat System", "Search Bar", "Notifications"
-        ]
+        self.rng = rng
+        self.clock = clock
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
+        self.backlog = Backlog(backlog)
+        self.capacity = capacity  # story points per sprint
+        self.delivered_points = 0
         self.sprint_count = 1
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
         
-        print(f"INITIALIZING AGILE PROJECT: {self.name}")
-        print("="*60)
-        print("Methodology: Scrum / Agile")
-        print("Cycle: 2-Week Sprints")
-        print("="*60 + "\n")
-        time.sleep(2)
+        self._say(f"INITIALIZING AGILE PROJECT: {self.name}")
+        self._say("="*60)
+        self._say("Methodology: Scrum / Agile")
+        self._say("Cycle: 2-Week Sprints")
+        self._say("="*60 + "\n")
+        self.clock.sleep(2)
+
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
 
     def run_sprint(self):
         if not self.backlog:
-            print("\n[!] Product Backlog is Empty! Project Complete.")
+            self._say("\n[!] Product Backlog is Empty! Project Complete.")
+            self.outcome = "completed"
             return False
 
-        print(f"\n+--- STARTING SPRINT {self.sprint_count}")
-        print(f"|    Product Backlog: {len(self.backlog)} items remaining")
+        self.phases_visited.append(f"Sprint {self.sprint_count}")
+        self._say(f"\n+--- STARTING SPRINT {self.sprint_count}")
+        self._say(f"|    Product Backlog: {len(self.backlog)} items remaining "
+                  f"({self.backlog.points} points)")
         
-        # Sprint Planning: Pick 2 items
-        sprint_tasks = self.backlog[:2]
-        self.backlog = self.backlog[2:]
-        print(f"|    [PLANNING] Selected for this Sprint: {sprint_tasks}")
-        time.sleep(1)
+        # Sprint Planning: fill the capacity in priority order
+        selected = self.backlog.plan_sprint(self.capacity)
+        sprint_tasks = [story for story, _ in selected]
+        self.delivered_points += sum(points for _, points in selected)
+        self._say(f"|    [PLANNING] Selected for this Sprint: {sprint_tasks}")
+        self.clock.sleep(1)
         
         # Development
-        print("|    [DEV] Coding & Testing...", end="")
-        sys.stdout.flush()
-        time.sleep(1)
-        print(" DONE")
+        self._say("|    [DEV] Coding & Testing...", end="", flush=True)
+        self.clock.sleep(1)
+        self._say(" DONE")
         
         # Deployment
-        print("|    [DEPLOY] Releasing v1.{}".format(self.sprint_count))
+        self._say("|    [DEPLOY] Releasing v1.{}".format(self.sprint_count))
         
         # Feedback Loop
-        print("|    [FEEDBACK] Gathering User Input...")
-        time.sleep(1)
+        self._say("|    [FEEDBACK] Gathering User Input...")
+        self.clock.sleep(1)
         
-        feedback = random.choice([
-            "Great work! No changes needed.",
-            "Great work! No changes needed.",
-            "Bug found in payment! (Added to backlog)",
-            "We need a 'Share' button! (Added to backlog)"
-        ])
+        feedback = self.rng.choice(FEEDBACK)
         
-        print(f"|    >> User says: '{feedback}'")
+        self._say(f"|    >> User says: '{feedback}'")
         
-        if "Added to backlog" in feedback:
-            new_item = "Bug Fix / New Feature"
-            self.backlog.append(new_item)
-            print(f"|    [+] '{new_item}' added to backlog.")
+        # Bugs jump the queue; feature requests join at the bottom
+        if feedback.startswith("Bug"):
+            new_item = f"Bug Fix (Sprint {self.sprint_count})"
+            self.backlog.add_to_top(new_item, BUG_POINTS)
+            self._say(f"|    [+] '{new_item}' added to top of backlog.")
+        elif "Added to backlog" in feedback:
+            new_item = f"New Feature (Sprint {self.sprint_count})"
+            self.backlog.add(new_item, FEATURE_POINTS)
+            self._say(f"|    [+] '{new_item}' added to backlog.")
             
-        print("+-------------------------------------------")
+        self._say("+-------------------------------------------")
         self.sprint_count += 1
         return True
 
+    def run(self, max_sprints=None):
+        """
+        Runs sprints until the backlog is empty, or for at most 'max_sprints'
+        sprints (outcome "in_progress" if work is left).
+        """
+        while max_sprints is None or self.sprint_count <= max_sprints:
+            if not self.run_sprint():
+                return self.outcome
+        self.outcome = "in_progress" if self.backlog else "completed"
+        return self.outcome
+
+# ------------------------------------------------------------------------------
+# Portfolio simulation
+# ------------------------------------------------------------------------------
+# Many teams are tracked by backlog size in story points only. A sprint burns
+# the team's capacity, then adds the points of one FEEDBACK draw, the same
+# model AgileSprint uses. The state lives in parallel arrays (one slot per
+# project), and every sprint advances all of them in one batched pass.
+# Capacity is treated as fully usable, so forecasts are slightly optimistic
+# next to AgileSprint, whose whole stories do not always fill a sprint.
+
+PortfolioForecast = namedtuple("PortfolioForecast", "completion burndown unfinished sprints")
+
+class AgilePortfolio:
+    """
+    backlog_points[i] and capacities[i] (points per sprint) of project i.
+    After run(), finished_at[i] is the sprint in which project i's backlog
+    emptied (None if it did not within the limit).
+    """
+
+    def __init__(self, backlog_points, capacities, rng=random):
+        if len(backlog_points) != len(capacities):
+            raise ValueError("backlog_points and capacities must have the same length")
+        self.rng = rng
+        self.remaining = list(backlog_points)
+        self.capacities = list(capacities)
+        self.finished_at = [0 if points <= 0 else None for points in self.remaining]
+        self._active = [i for i, points in enumerate(self.remaining) if points > 0]
+        self._increments = [feedback_points(feedback) for feedback in FEEDBACK]
+        self.sprint = 0
+
+    def __len__(self):
+        return len(self.remaining)
+
+    @property
+    def active(self):
+        return len(self._active)
+
+    def step(self):
+        """Advances every unfinished project by one sprint."""
+        self.sprint += 1
+        active = self._active
+        remaining = self.remaining
+        capacities = self.capacities
+        burned = [max(remaining[i] - capacities[i], 0) for i in active]
+        added = self.rng.choices(self._increments, k=len(active))
+        updated = [b + a for b, a in zip(burned, added)]
+        for i, points in zip(active, updated):
+            remaining[i] = points
+        finished = [i for i, points in zip(active, updated) if points == 0]
+        for i in finished:
+            self.finished_at[i] = self.sprint
+        if finished:
+            self._active = [i for i, points in zip(active, updated) if points]
+
+    def run(self, max_sprints=1000):
+        while self._active and self.sprint < max_sprints:
+            self.step()
+        return self.finished_at
+
+def forecast_portfolio(backlog_points, capacities, replicas=1000, max_sprints=500,
+                       quantiles=(0.5, 0.85, 0.95), rng=random):
+    """
+    Monte Carlo forecast for a portfolio: all replicas x projects run in one
+    lockstep AgilePortfolio. Returns a PortfolioForecast with
+      completion[i]  {q: sprint in which project i's backlog empties}
+                     (None where more than 1 - q of the runs did not finish)
+      burndown[k]    {q: portfolio points left after sprint k+1}
+      unfinished     fraction of project runs still open at max_sprints
+    """
+    projects = len(backlog_points)
+    portfolio = AgilePortfolio(list(backlog_points) * replicas, list(capacities) * replicas, rng)
+    burndown = []
+    while portfolio.active and portfolio.sprint < max_sprints:
+        portfolio.step()
+        totals = [sum(portfolio.remaining[r * projects:(r + 1) * projects]) for r in range(replicas)]
+        totals.sort()
+        burndown.append({q: nearest_rank(totals, q) for q in quantiles})
+
+    completion = []
+    for i in range(projects):
+        sprints = sorted(portfolio.finished_at[i::projects], key=lambda k: float("inf") if k is None else k)
+        completion.append({q: nearest_rank(sprints, q) for q in quantiles})
+    unfinished = portfolio.active / len(portfolio)
+    return PortfolioForecast(completion, burndown, unfinished, portfolio.sprint)
+
+# Both backlogs replay the same operations from the same rng draws: plan a
+# sprint, then on half of the sprints add a bug on top and move a random
+# original story (if still open) to the top or the bottom.
+
+def _backlog_change(rng, stories):
+    """(add a bug?, story to move, move it to the top?) for one sprint."""
+    if rng.random() >= 0.5:
+        return False, None, False
+    return True, stories[rng.randrange(len(stories))][0], rng.random() < 0.5
+
+def _list_backlog_project(stories, capacity, rng):
+    """Reference: the original list backlog (slicing, O(n) inserts)."""
+    backlog = list(stories)
+    sprints = 0
+    while backlog:
+        taken, remaining = 0, capacity
+        while taken < len(backlog) and (backlog[taken][1] <= remaining or taken == 0):
+            remaining -= backlog[taken][1]
+            taken += 1
+        backlog = backlog[taken:]
+        sprints += 1
+        if backlog:
+            bug, story, to_top = _backlog_change(rng, stories)
+            if bug:
+                backlog.insert(0, (f"bug-{sprints}", BUG_POINTS))
+                position = next((i for i, (name, _) in enumerate(backlog) if name == story), None)
+                if position is not None:
+                    entry = backlog.pop(position)
+                    backlog.insert(0 if to_top else len(backlog), entry)
+    return sprints
+
+def _heap_backlog_project(stories, capacity, rng):
+    backlog = Backlog(stories)
+    sprints = 0
+    while backlog:
+        backlog.plan_sprint(capacity)
+        sprints += 1
+        if backlog:
+            bug, story, to_top = _backlog_change(rng, stories)
+            if bug:
+                backlog.add_to_top(f"bug-{sprints}", BUG_POINTS)
+                if story in backlog:
+                    backlog.reprioritize(story, backlog.top - 1 if to_top else backlog.bottom + 1)
+    return sprints
+
+def benchmark_backlog(sizes=(10**3, 10**4, 10**5), capacity=20, seed=0):
+    """
+    Runs long simulated projects (n stories of 1-8 points, a bug and a
+    reprioritization on half of the sprints) with the list backlog and with
+    Backlog, on the same operations. Returns (n, sprints, list seconds, heap
+    seconds, speedup) rows.
+    """
+    rows = []
+    for n in sizes:
+        setup = random.Random(seed)
+        stories = [(f"story-{i}", setup.randint(1, 8)) for i in range(n)]
+        start = time.perf_counter()
+        sprints = _list_backlog_project(stories, capacity, random.Random(seed))
+        list_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        heap_sprints = _heap_backlog_project(stories, capacity, random.Random(seed))
+        heap_seconds = time.perf_counter() - start
+        if heap_sprints != sprints:
+            raise AssertionError(f"Backlogs diverged: {sprints} list vs {heap_sprints} heap sprints")
+        rows.append((n, sprints, list_seconds, heap_seconds, list_seconds / heap_seconds))
+    return rows
+
 if __name__ == "__main__":
     project = AgileSprint("Ride Sharing App")
     
     # Run a few sprints
     while project.sprint_count <= 3:
         project.run_sprint()
-        time.sleep(1)
+        project.clock.sleep(1)
     
     print("\n... Sprints continue until backlog is empty ...")
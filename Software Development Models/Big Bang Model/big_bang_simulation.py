@@ -3,14 +3,14 @@ import sys
 import os
 import random
 
-def run_simulation():
+def run_simulation(rng=random, clock=time):
     os.system('cls' if os.name == 'nt' else 'clear')
     print("BIG BANG MODEL SIMULATION")
     print("="*60)
     print("Project: 24-Hour Hackathon")
     print("Plan: NONE. Just Code!")
     print("="*60 + "\n")
-    time.sleep(2)
+    clock.sleep(2)
     
     resources = 100
     print(f"Starting Resources: {resources}%")
@@ -18,22 +18,22 @@ def run_simulation():
     # Chaos Phase
     for hour in range(1, 25, 4):
         print(f"\n[Hour {hour}] Coding frantically...")
-        event = random.choice([
+        event = rng.choice([
             "Found a cool library! (+Speed)",
             "Wait, what is this variable name? (-Confusion)",
             "Developer A fell asleep. (-Manpower)",
             "Merge Conflict! We overwrote everything! (-Disaster)"
         ])
         print(f"          Event: {event}")
-        time.sleep(1)
+        clock.sleep(1)
         
     print("\n" + "-"*40)
     print("DEADLINE REACHED. DEMO TIME.")
     print("-"*40)
-    time.sleep(2)
+    clock.sleep(2)
     
     # Random Outcome
-    outcome = random.randint(1, 10)
+    outcome = rng.randint(1, 10)
     
     if outcome > 7:
         print("\nRESULT: [SUCCESS!] Useable Software.")
@@ -1,16 +1,64 @@
 import time
 import sys
 import os
+import random
+from collections import namedtuple
+
+# Simulated time to re-run one existing feature's regression tests
+REGRESSION_SECONDS_PER_FEATURE = 0.2
+
+class DependencyIndex:
+    """
+    Feature -> features it depends on (calls into, integrates with).
+    Features must be added after their dependencies.
+    """
+
+    def __init__(self):
+        self.depends_on = {}
+
+    def __contains__(self, feature):
+        return feature in self.depends_on
+
+    def __len__(self):
+        return len(self.depends_on)
+
+    def add(self, feature, depends_on=()):
+        if feature in self.depends_on:
+            raise ValueError(f"'{feature}' is already indexed")
+        missing = [d for d in depends_on if d not in self.depends_on]
+        if missing:
+            raise ValueError(f"'{feature}' depends on unknown features: {missing}")
+        self.depends_on[feature] = set(depends_on)
+
+    def reachable(self, features):
+        """Every feature reachable from 'features' through dependencies."""
+        seen = set()
+        stack = [d for f in features for d in self.depends_on[f]]
+        while stack:
+            feature = stack.pop()
+            if feature not in seen:
+                seen.add(feature)
+                stack.extend(self.depends_on[feature] - seen)
+        return seen
 
 class IncrementalProject:
     """
     Simulates the Incremental Process Model (Staged Delivery).
     The system is built in 3 increments, each adding specific features.
+
+    With selective=True, regression testing after an increment covers only
+    the existing features reachable from the new ones in the dependency
+    index instead of every existing feature.
     """
     
-    def __init__(self, name):
+    def __init__(self, name, clock=time, selective=True):
         self.name = name
+        self.clock = clock
+        self.selective = selective
         self.current_features = []
+        self.dependencies = DependencyIndex()
+        self.regression_seconds = 0.0
+        self.baseline_regression_seconds = 0.0  # cost of re-testing everything
         os.system('cls' if os.name == 'nt' else 'clear')
         
         print(f"INITIALIZING INCREMENTAL PROJECT: {self.name}")
@@ -18,15 +66,17 @@ class IncrementalProject:
         print("Strategy: Staged Delivery")
         print("Goal: Build a full User Management System in steps.")
         print("="*60 + "\n")
-        time.sleep(2)
+        self.clock.sleep(2)
 
     def _run_stage(self, stage_name):
         print(f"   [-->] {stage_name}...", end="")
         sys.stdout.flush()
-        time.sleep(0.6)
+        self.clock.sleep(0.6)
         print(" DONE")
 
-    def deliver_increment(self, increment_number, features_to_add):
+    def deliver_increment(self, increment_number, features_to_add, depends_on=None):
+        """depends_on: {new feature: features it depends on} (default: none)."""
+        depends_on = depends_on or {}
         print(f"\n+--- STARTING INCREMENT {increment_number}")
         print(f"|    Features to build: {', '.join(features_to_add)}")
         print("|    -------------------------------------------")
@@ -39,18 +89,89 @@ class IncrementalProject:
         
         # 3. Testing (New + Regression)
         self._run_stage("Unit Testing")
+        for feature in features_to_add:
+            self.dependencies.add(feature, depends_on.get(feature, ()))
         if self.current_features:
-            self._run_stage("Regression Testing (Checking old features)")
+            baseline = len(self.current_features) * REGRESSION_SECONDS_PER_FEATURE
+            if self.selective:
+                impacted = self.dependencies.reachable(features_to_add).difference(features_to_add)
+                seconds = len(impacted) * REGRESSION_SECONDS_PER_FEATURE
+                print(f"   [-->] Regression Testing ({len(impacted)} of "
+                      f"{len(self.current_features)} old features impacted)...", end="")
+            else:
+                seconds = baseline
+                print("   [-->] Regression Testing (Checking old features)...", end="")
+            sys.stdout.flush()
+            self.clock.sleep(seconds)
+            print(" DONE")
+            self.regression_seconds += seconds
+            self.baseline_regression_seconds += baseline
             
         # 4. Implementation
         print("|    [+] DEPLOYING INCREMENT...")
-        time.sleep(1)
+        self.clock.sleep(1)
         
         self.current_features.extend(features_to_add)
         print(f"|    [OK] INCREMENT {increment_number} RELEASED!")
         print(f"|    CURRENT SYSTEM STATE: {self.current_features}")
         print("+-------------------------------------------")
-        time.sleep(2)
+        self.clock.sleep(2)
+
+# ------------------------------------------------------------------------------
+# Regression-time savings on large projects
+# ------------------------------------------------------------------------------
+RegressionReport = namedtuple(
+    "RegressionReport",
+    "features increments baseline_tests selected_tests baseline_seconds selected_seconds "
+    "saved_seconds saved_fraction")
+
+def synthetic_increments(features=5000, increments=200, modules=100, max_dependencies=3,
+                         core=20, core_probability=0.3, rng=random):
+    """
+    A random modular project: 'core' shared features delivered first, then
+    the rest spread evenly over the increments. Every feature belongs to one
+    of 'modules' modules and depends on up to 'max_dependencies' earlier
+    features of its module, and on a core feature with 'core_probability'.
+    Returns a list of increments, each a list of (feature, dependencies).
+    """
+    core_features = [f"core-{i}" for i in range(core)]
+    by_module = [[] for _ in range(modules)]
+    plan = [[(feature, []) for feature in core_features]]
+    remaining = features - core
+    for k in range(increments):
+        batch = []
+        for i in range(remaining // increments + (k < remaining % increments)):
+            module = rng.randrange(modules)
+            siblings = by_module[module]
+            deps = rng.sample(siblings, min(len(siblings), rng.randint(0, max_dependencies)))
+            if core_features and rng.random() < core_probability:
+                deps.append(rng.choice(core_features))
+            feature = f"m{module}-{len(siblings)}"
+            siblings.append(feature)
+            batch.append((feature, deps))
+        plan.append(batch)
+    return plan
+
+def regression_savings(plan):
+    """
+    Replays a plan of increments (see synthetic_increments) without pacing
+    and compares full regression runs with dependency-based selection.
+    """
+    index = DependencyIndex()
+    existing = 0
+    baseline_tests = selected_tests = 0
+    for batch in plan:
+        for feature, deps in batch:
+            index.add(feature, deps)
+        if existing:
+            baseline_tests += existing
+            new = [feature for feature, _ in batch]
+            selected_tests += len(index.reachable(new).difference(new))
+        existing += len(batch)
+    baseline = baseline_tests * REGRESSION_SECONDS_PER_FEATURE
+    selected = selected_tests * REGRESSION_SECONDS_PER_FEATURE
+    return RegressionReport(existing, len(plan), baseline_tests, selected_tests, baseline, selected,
+                            baseline - selected, (baseline - selected) / baseline if baseline else 0.0)
 
 if __name__ == "__main__":
     project = IncrementalProject("Enterprise Auth System")
@@ -59,10 +180,14 @@ if __name__ == "__main__":
     project.deliver_increment(1, ["Login", "Register"])
     
     # Increment 2: User Profile
-    project.deliver_increment(2, ["Upload Avatar", "Edit Profile", "Change Password"])
+    project.deliver_increment(2, ["Upload Avatar", "Edit Profile", "Change Password"],
+                             {"Edit Profile": ["Login"], "Change Password": ["Login"]})
     
     # Increment 3: Admin Features
-    project.deliver_increment(3, ["Ban User", "View Analytics", "Export Data"])
+    project.deliver_increment(3, ["Ban User", "View Analytics", "Export Data"],
+                             {"Ban User": ["Edit Profile"], "Export Data": ["View Analytics"]})
     
     print("\n" + "="*60)
     print("FINAL PRODUCT DELIVERED SUCCESSFULLY")
+    print(f"Regression testing: {project.regression_seconds:.1f}s "
+          f"(re-testing everything: {project.baseline_regression_seconds:.1f}s)")
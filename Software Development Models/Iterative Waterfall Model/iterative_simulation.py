@@ -2,6 +2,12 @@ import time
 import sys
 import os
 import random
+from collections import Counter, namedtuple
+from itertools import repeat
+
+# Phases that can fail validation, with their defect probability. A defect
+# sends the project back one phase; after redoing it, the failed phase runs again.
+DEFECT_RATES = {1: 0.35, 2: 0.35, 3: 0.35}
 
 class IterativeWaterfallProject:
     """
@@ -10,8 +16,14 @@ class IterativeWaterfallProject:
     forcing the project to return to a previous phase.
     """
     
-    def __init__(self, name):
+    def __init__(self, name, rng=random, clock=time, headless=False):
         self.name = name
+        self.rng = rng
+        self.clock = clock
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
+        self.rework_loops = 0
         self.indent_level = 0
         self.phase_map = {
             0: "Requirements",
@@ -22,66 +34,205 @@ class IterativeWaterfallProject:
         }
         
         # Clear screen
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
         
-        print(f"INITIALIZING ITERATIVE PROJECT: {self.name}")
-        print("="*60)
-        print("This simulation includes RANDOMIZED DEFECTS.")
-        print("Watch for '<-- FEEDBACK LOOP' events where the project steps back.")
-        print("="*60 + "\n")
-        time.sleep(2)
+        self._say(f"INITIALIZING ITERATIVE PROJECT: {self.name}")
+        self._say("="*60)
+        self._say("This simulation includes RANDOMIZED DEFECTS.")
+        self._say("Watch for '<-- FEEDBACK LOOP' events where the project steps back.")
+        self._say("="*60 + "\n")
+        self.clock.sleep(2)
+
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
 
     def _print_step(self, phase_index, status, message=""):
         indent = " " * (phase_index * 6)
         name = self.phase_map[phase_index].upper()
         
         if status == "START":
-            print(f"{indent}+--- [PHASE {phase_index + 1}: {name}]")
-            print(f"{indent}|    Status: Starting...")
+            self._say(f"{indent}+--- [PHASE {phase_index + 1}: {name}]")
+            self._say(f"{indent}|    Status: Starting...")
         elif status == "WORK":
-            print(f"{indent}|    >> {message}")
-            time.sleep(0.6)
+            self._say(f"{indent}|    >> {message}")
+            self.clock.sleep(0.6)
         elif status == "DONE":
-            print(f"{indent}|    [COMPLETE]")
-            print(f"{indent}V")
+            self._say(f"{indent}|    [COMPLETE]")
+            self._say(f"{indent}V")
         elif status == "FAIL":
-            print(f"{indent}|    [X] CRITICAL ISSUE FOUND: {message}")
-            print(f"{indent}^")
-            print(f"{indent}|")
-            print(f"{indent}+--- <-- FEEDBACK LOOP TRIGGERED (Reverting...)")
-            time.sleep(1.5)
+            self._say(f"{indent}|    [X] CRITICAL ISSUE FOUND: {message}")
+            self._say(f"{indent}^")
+            self._say(f"{indent}|")
+            self._say(f"{indent}+--- <-- FEEDBACK LOOP TRIGGERED (Reverting...)")
+            self.clock.sleep(1.5)
 
     def run_phase(self, phase_index):
-        if phase_index > 4:
-            print("\n" + "="*60)
-            print("PROJECT DEPLOYED SUCCESSFULLY!")
-            return
-
-        self._print_step(phase_index, "START")
-        
-        # Simulating work
-        tasks = [f"Performing {self.phase_map[phase_index]} task {i+1}" for i in range(3)]
-        for task in tasks:
-            self._print_step(phase_index, "WORK", task)
-        
-        # Validation Logic (Simulation of Feedback)
-        # 30% chance of failure in Design, Implementation, or Testing
-        if phase_index in [1, 2, 3] and random.random() < 0.35:
-            issue = f"Defect detected in {self.phase_map[phase_index]}!"
-            self._print_step(phase_index, "FAIL", issue)
+        """Runs from 'phase_index' until deployment, stepping back on defects."""
+        returning = []  # failed phases waiting to be redone, innermost last
+        while phase_index <= 4:
+            name = self.phase_map[phase_index]
+            self.phases_visited.append(name)
+            self._print_step(phase_index, "START")
             
-            # Recursive Feedback: Go back to previous phase
-            print("\n[!] Re-evaluating previous phase due to feedback...")
-            time.sleep(1)
-            self.run_phase(phase_index - 1)
+            # Simulating work
+            tasks = [f"Performing {name} task {i+1}" for i in range(3)]
+            for task in tasks:
+                self._print_step(phase_index, "WORK", task)
             
-            # After fixing previous phase, we redo THIS phase
-            print(f"\n[!] Returning to {self.phase_map[phase_index]} after fixes...")
-            self.run_phase(phase_index)
-        else:
-            self._print_step(phase_index, "DONE")
-            self.run_phase(phase_index + 1)
+            # Validation Logic (Simulation of Feedback)
+            # 35% chance of failure in Design, Implementation, or Testing
+            if phase_index in DEFECT_RATES and self.rng.random() < DEFECT_RATES[phase_index]:
+                self._print_step(phase_index, "FAIL", f"Defect detected in {name}!")
+                self.rework_loops += 1
+                
+                # Feedback: go back to the previous phase, then redo this one
+                self._say("\n[!] Re-evaluating previous phase due to feedback...")
+                self.clock.sleep(1)
+                returning.append(phase_index)
+                phase_index -= 1
+            else:
+                self._print_step(phase_index, "DONE")
+                phase_index += 1
+                if returning and returning[-1] == phase_index:
+                    returning.pop()
+                    self._say(f"\n[!] Returning to {self.phase_map[phase_index]} after fixes...")
+
+        self._say("\n" + "="*60)
+        self._say("PROJECT DEPLOYED SUCCESSFULLY!")
+        self.outcome = "deployed"
+
+    def run(self):
+        """Runs from Requirements to Deployment; returns the outcome."""
+        self.run_phase(0)
+        return self.outcome
+
+# ------------------------------------------------------------------------------
+# Rework engine
+# ------------------------------------------------------------------------------
+# run_phase is a Markov chain on the phases 0..4 plus the absorbing state
+# "deployed" (5): phase k fails with probability p_k and moves to k-1,
+# otherwise it moves to k+1. With Q the transient part of the transition
+# matrix, the fundamental matrix N = (I - Q)^-1 holds the expected number of
+# visits to each phase, so everything expected follows without simulation.
+
+ReworkSample = namedtuple("ReworkSample", "runs mean_executions mean_rework_loops rework_counts")
+
+def _invert(matrix):
+    """Gauss-Jordan inverse with partial pivoting (small dense matrices)."""
+    n = len(matrix)
+    rows = [list(row) + [float(i == j) for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if rows[pivot][col] == 0:
+            raise ValueError("Matrix is singular: some phase can never reach deployment")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        scale = rows[col][col]
+        rows[col] = [value / scale for value in rows[col]]
+        for r in range(n):
+            factor = rows[r][col]
+            if r != col and factor:
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [row[n:] for row in rows]
+
+class ReworkChain:
+    """
+    Absorbing Markov chain of an iterative waterfall with 'phases' phases and
+    per-phase defect probabilities 'defect_rates' ({phase index: p}). Phase 0
+    must not fail (there is nothing to step back to).
+    """
+
+    def __init__(self, defect_rates=DEFECT_RATES, phases=5):
+        if any(not 0 < k < phases for k in defect_rates):
+            raise ValueError(f"Defect rates are allowed for phases 1..{phases - 1} only")
+        if any(not 0 <= p < 1 for p in defect_rates.values()):
+            raise ValueError("Defect probabilities must be in [0, 1)")
+        self.phases = phases
+        self.rates = [defect_rates.get(k, 0.0) for k in range(phases)]
+
+    def transition_matrix(self):
+        """(phases + 1) x (phases + 1) matrix; the last state is 'deployed'."""
+        size = self.phases + 1
+        P = [[0.0] * size for _ in range(size)]
+        for k, p in enumerate(self.rates):
+            if p:
+                P[k][k - 1] = p
+            P[k][k + 1] = 1.0 - p
+        P[-1][-1] = 1.0
+        return P
+
+    def fundamental_matrix(self):
+        """N[i][j]: expected visits to phase j when starting in phase i."""
+        n = self.phases
+        P = self.transition_matrix()
+        return _invert([[float(i == j) - P[i][j] for j in range(n)] for i in range(n)])
+
+    def expected_visits(self, start=0):
+        return self.fundamental_matrix()[start]
+
+    def expected_executions(self, start=0):
+        """Expected number of phase executions until deployment."""
+        return sum(self.expected_visits(start))
+
+    def expected_rework_loops(self, start=0):
+        """Expected number of defects (feedback loops) until deployment."""
+        return sum(v * p for v, p in zip(self.expected_visits(start), self.rates))
+
+    def rework_distribution(self, start=0, tol=1e-12, max_loops=10000):
+        """
+        [P(0 loops), P(1 loop), ...] until the remaining mass is below 'tol'.
+        Between two defects the project only moves forward, so the mass of
+        each loop count is pushed through the phases in one forward pass.
+        """
+        n = self.phases
+        layer = [0.0] * n
+        layer[start] = 1.0
+        distribution = []
+        remaining = 1.0
+        while remaining > tol and len(distribution) <= max_loops:
+            next_layer = [0.0] * n
+            deployed = 0.0
+            for k in range(n):
+                mass = layer[k]
+                if not mass:
+                    continue
+                p = self.rates[k]
+                if p:
+                    next_layer[k - 1] += mass * p
+                if k + 1 < n:
+                    layer[k + 1] += mass * (1.0 - p)
+                else:
+                    deployed += mass * (1.0 - p)
+            distribution.append(deployed)
+            remaining -= deployed
+            layer = next_layer
+        return distribution
+
+    def sample(self, runs, start=0, rng=random):
+        """
+        Simulates 'runs' projects with a loop (no recursion, constant memory)
+        and returns a ReworkSample with a Counter of rework loops per run.
+        """
+        draw = rng.random
+        rates = self.rates
+        n = self.phases
+        counts = Counter()
+        executions = 0
+        for _ in repeat(None, runs):
+            k = start
+            loops = 0
+            while k < n:
+                executions += 1
+                if draw() < rates[k]:
+                    loops += 1
+                    k -= 1
+                else:
+                    k += 1
+            counts[loops] += 1
+        mean_loops = sum(loops * c for loops, c in counts.items()) / runs
+        return ReworkSample(runs, executions / runs, mean_loops, counts)
 
 if __name__ == "__main__":
     project = IterativeWaterfallProject("E-Commerce Portal v2.0")
-    project.run_phase(0) # Start at Requirements
+    project.run() # Start at Requirements
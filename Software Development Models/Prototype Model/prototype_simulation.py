@@ -2,58 +2,246 @@ import time
 import sys
 import os
 import random
+from array import array
+from collections import namedtuple
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_clock import VirtualClock
+from sim_random import batched
+
+# Pacing of one iteration: build, client review, and refining after a rejection
+BUILD_SECONDS = 1.5
+REVIEW_SECONDS = 1
+REFINE_SECONDS = 2
+
+def scripted_acceptance(version):
+    """The scripted client: rejects v1 and v2, approves v3."""
+    return 1.0 if version >= 3 else 0.0
+
+def constant_acceptance(p):
+    """Every version is approved with probability p."""
+    def curve(version):
+        return p
+    return curve
+
+def learning_acceptance(first, growth):
+    """
+    P(approve v1) = first; each rejection removes a 'growth' share of the
+    remaining doubt: p_v = 1 - (1 - first) * (1 - growth)^(v - 1).
+    """
+    def curve(version):
+        return 1.0 - (1.0 - first) * (1.0 - growth) ** (version - 1)
+    return curve
 
 class PrototypeSimulation:
-    def __init__(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
-        print("PROTOTYPE MODEL SIMULATION")
-        print("="*60)
-        print("Goal: Build a Login Screen that the Client loves.")
-        print("Process: Build -> Show Client -> Get Feedback -> Fix.")
-        print("="*60 + "\n")
-        time.sleep(2)
+    """
+    'acceptance' maps a version number to the client's approval probability.
+    The default is the scripted client, which needs no random draws.
+    """
+
+    def __init__(self, clock=time, headless=False, acceptance=scripted_acceptance, rng=random):
+        self.clock = clock
+        self.acceptance = acceptance
+        self.rng = rng
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
+        self._say("PROTOTYPE MODEL SIMULATION")
+        self._say("="*60)
+        self._say("Goal: Build a Login Screen that the Client loves.")
+        self._say("Process: Build -> Show Client -> Get Feedback -> Fix.")
+        self._say("="*60 + "\n")
+        self.clock.sleep(2)
         
         self.version = 1
         self.approved = False
 
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
+
     def build_prototype(self):
-        print(f"\n--- Building Prototype v{self.version} ---")
-        print("    [DEV] Coding quick UI mock-up...")
-        time.sleep(1.5)
-        print("    [DEV] Done. Sending to client.")
+        self.phases_visited.append(f"Prototype v{self.version}")
+        self._say(f"\n--- Building Prototype v{self.version} ---")
+        self._say("    [DEV] Coding quick UI mock-up...")
+        self.clock.sleep(BUILD_SECONDS)
+        self._say("    [DEV] Done. Sending to client.")
 
     def client_evaluation(self):
-        print(f"\n--- Client Review v{self.version} ---")
-        time.sleep(1)
+        self._say(f"\n--- Client Review v{self.version} ---")
+        self.clock.sleep(REVIEW_SECONDS)
         
         # Simulated Client Feedback Logic
-        if self.version == 1:
-            print("    [CLIENT]: \"I don't like the color. Make it Blue.\"")
-            print("    [DECISION]: REJECTED. Back to design.")
+        if self.acceptance is not scripted_acceptance:
+            p = self.acceptance(self.version)
+            if p >= 1.0 or (p > 0.0 and self.rng.random() < p):
+                self._say("    [CLIENT]: \"Yes, that works for us.\"")
+                self._say("    [DECISION]: APPROVED! Proceed to final development.")
+                return True
+            self._say("    [CLIENT]: \"Not quite there yet.\"")
+            self._say("    [DECISION]: REJECTED. Back to design.")
+            return False
+        elif self.version == 1:
+            self._say("    [CLIENT]: \"I don't like the color. Make it Blue.\"")
+            self._say("    [DECISION]: REJECTED. Back to design.")
             return False
         elif self.version == 2:
-            print("    [CLIENT]: \"Better. But the 'Login' button is too small.\"")
-            print("    [DECISION]: REJECTED. Back to design.")
+            self._say("    [CLIENT]: \"Better. But the 'Login' button is too small.\"")
+            self._say("    [DECISION]: REJECTED. Back to design.")
             return False
         else:
-            print("    [CLIENT]: \"PERFECT! This is exactly what I wanted.\"")
-            print("    [DECISION]: APPROVED! Proceed to final development.")
+            self._say("    [CLIENT]: \"PERFECT! This is exactly what I wanted.\"")
+            self._say("    [DECISION]: APPROVED! Proceed to final development.")
             return True
 
-    def run(self):
+    def run(self, max_versions=None):
+        """Iterates until the client approves, or gives up after 'max_versions' versions."""
         while not self.approved:
             self.build_prototype()
             if self.client_evaluation():
                 self.approved = True
                 break
+            elif max_versions is not None and self.version >= max_versions:
+                break
             else:
-                print("    [PM]: Note taken. Refining requirements...")
+                self._say("    [PM]: Note taken. Refining requirements...")
                 self.version += 1
-                time.sleep(2)
+                self.clock.sleep(REFINE_SECONDS)
         
-        print("\n" + "="*60)
-        print("FINAL PHASE: discard prototype code & write Production Code.")
-        print("PROJECT SUCCESSFUL.")
+        if not self.approved:
+            self._say(f"\n[PM]: No approval after {self.version} versions. Prototype shelved.")
+            self.outcome = "unresolved"
+            return self.outcome
+        
+        self._say("\n" + "="*60)
+        self._say("FINAL PHASE: discard prototype code & write Production Code.")
+        self._say("PROJECT SUCCESSFUL.")
+        self.outcome = "approved"
+        return self.outcome
+
+# ------------------------------------------------------------------------------
+# Batched client evaluation
+# ------------------------------------------------------------------------------
+# A client accepts version v with probability curve(v), so the number of
+# iterations V is a discrete survival time and the cost of a client is
+#     V * (BUILD_SECONDS + REVIEW_SECONDS) + (V - 1) * REFINE_SECONDS.
+# The batched evaluator keeps all clients in arrays and moves every client
+# that is still undecided forward one version per pass.
+
+PrototypeEstimate = namedtuple(
+    "PrototypeEstimate",
+    "clients mean_iterations mean_cost iteration_distribution unresolved")
+Agreement = namedtuple("Agreement", "exact_mean batched_mean reference_mean batched_z reference_z agree")
+
+def iteration_cost(iterations):
+    return iterations * (BUILD_SECONDS + REVIEW_SECONDS) + (iterations - 1) * REFINE_SECONDS
+
+def _estimate(counts, clients, unresolved):
+    resolved = clients - unresolved
+    if not resolved:
+        return PrototypeEstimate(clients, float("nan"), float("nan"), {}, unresolved / clients)
+    return PrototypeEstimate(
+        clients,
+        sum(v * n for v, n in counts.items()) / resolved,
+        sum(iteration_cost(v) * n for v, n in counts.items()) / resolved,
+        {v: n / clients for v, n in sorted(counts.items())},
+        unresolved / clients)
+
+def evaluate_clients(curve=scripted_acceptance, clients=10**6, max_versions=1000, rng=random):
+    """
+    Advances 'clients' synthetic clients together, one version per pass,
+    until every client approved (or max_versions is reached). Returns
+    (PrototypeEstimate, iterations array: approving version per client, 0 if
+    unresolved).
+    """
+    bernoullis = batched(rng).bernoullis
+    iterations = array("I", bytes(4 * clients))
+    active = range(clients)
+    counts = {}
+    version = 0
+    while active and version < max_versions:
+        version += 1
+        p = curve(version)
+        if p >= 1.0:
+            accepted, active = active, []
+        elif p <= 0.0:
+            continue
+        else:
+            decisions = bernoullis(len(active), p)
+            accepted = [c for c, yes in zip(active, decisions) if yes]
+            active = [c for c, yes in zip(active, decisions) if not yes]
+        for c in accepted:
+            iterations[c] = version
+        if accepted:
+            counts[version] = len(accepted)
+    return _estimate(counts, clients, len(active)), iterations
+
+def reference_clients(curve=scripted_acceptance, clients=1000, max_versions=1000, rng=random):
+    """
+    Runs each client through PrototypeSimulation itself (headless, no pacing).
+    Clients still undecided after max_versions count as unresolved, exactly
+    as in evaluate_clients.
+    """
+    counts = {}
+    unresolved = 0
+    clock = VirtualClock()
+    for _ in range(clients):
+        sim = PrototypeSimulation(clock=clock, headless=True, acceptance=curve, rng=rng)
+        if sim.run(max_versions) == "unresolved":
+            unresolved += 1
+        else:
+            counts[sim.version] = counts.get(sim.version, 0) + 1
+    return _estimate(counts, clients, unresolved)
+
+def expected_iterations(curve=scripted_acceptance, max_versions=1000):
+    """
+    Exact (E[V], E[V^2]) over the clients that approve within max_versions,
+    from P(V = v) = P(V >= v) * curve(v). Both are nan if none can approve.
+    """
+    survive = 1.0
+    resolved = first = second = 0.0
+    for version in range(1, max_versions + 1):
+        if survive < 1e-15:
+            break
+        approve = survive * min(max(curve(version), 0.0), 1.0)
+        resolved += approve
+        first += version * approve
+        second += version * version * approve
+        survive -= approve
+    if not resolved:
+        return float("nan"), float("nan")
+    return first / resolved, second / resolved
+
+def verify_agreement(curve=scripted_acceptance, clients=10**5, reference_runs=2000,
+                     max_versions=1000, tolerance=4.0, rng=random):
+    """
+    Checks the batched evaluator and the per-client reference path against the
+    exact mean number of iterations of the clients that approve within
+    max_versions: both must lie within 'tolerance' standard errors of it.
+    """
+    exact, second = expected_iterations(curve, max_versions)
+    sd = max(second - exact * exact, 0.0) ** 0.5
+    batched, _ = evaluate_clients(curve, clients, max_versions, rng=rng)
+    reference = reference_clients(curve, reference_runs, max_versions, rng=rng)
+
+    def z(estimate, n):
+        if exact != exact:  # nobody can approve
+            return 0.0 if estimate.unresolved == 1.0 else float("inf")
+        n *= 1.0 - estimate.unresolved
+        if not n:
+            return float("inf")
+        error = sd / n ** 0.5
+        difference = estimate.mean_iterations - exact
+        return difference / error if error else (0.0 if abs(difference) < 1e-12 else float("inf"))
+
+    batched_z = z(batched, clients)
+    reference_z = z(reference, reference_runs)
+    return Agreement(exact, batched.mean_iterations, reference.mean_iterations, batched_z, reference_z,
+                     abs(batched_z) <= tolerance and abs(reference_z) <= tolerance)
 
 if __name__ == "__main__":
     sim = PrototypeSimulation()
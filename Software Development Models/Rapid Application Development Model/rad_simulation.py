@@ -2,6 +2,42 @@ import time
 import sys
 import os
 import random
+import heapq
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+
+DEFAULT_TEAMS = {
+    "Team UI": "Frontend",
+    "Team DB": "Database",
+    "Team API": "Logic"
+}
+
+PROGRESS_STEPS = [
+    "Building Prototype", "User Feedback Session",
+    "Refining Component", "Automated Testing"
+]
+
+# teams, workers, tasks, busy (sum of task durations), makespan (elapsed with
+# the pool, summed over the sprints), throughput (tasks per second),
+# utilization (busy / (workers * makespan)) and speedup (busy / makespan, i.e.
+# versus one team at a time)
+TeamReport = namedtuple("TeamReport",
+                        "teams workers tasks busy makespan throughput utilization speedup")
+
+def _pool_makespan(workloads, workers):
+    """Elapsed time when a FIFO pool of 'workers' runs the workloads in order."""
+    free = [0.0] * min(workers, len(workloads))
+    for load in workloads:
+        heapq.heapreplace(free, free[0] + load)
+    return max(free, default=0.0)
+
+def _team_report(teams, workers, durations, makespan):
+    busy = sum(durations)
+    tasks = len(durations)
+    return TeamReport(teams, workers, tasks, busy, makespan,
+                      tasks / makespan if makespan else 0.0,
+                      busy / (workers * makespan) if makespan else 0.0,
+                      busy / makespan if makespan else 0.0)
 
 class RADProject:
     """
@@ -10,67 +46,127 @@ class RADProject:
     1. Parallel Development (Teams working at once)
     2. Time-Boxing (Strict 60-day deadline)
     3. User Feedback Loops
+
+    In every sprint each team's work is a task on a pool of 'max_workers'
+    threads (default: one per team), and the sprint ends when all of them
+    are done; the last one is the integration barrier before the Cutover.
+    Worker threads only pause(); the project clock advances once per sprint
+    by the sprint's makespan, so report.makespan matches clock time.
     """
     
-    def __init__(self, name):
+    def __init__(self, name, rng=random, clock=time, headless=False, teams=None,
+                 max_workers=None):
         self.name = name
+        self.rng = rng
+        self.clock = clock
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
+        self.teams = dict(DEFAULT_TEAMS if teams is None else teams)
+        self.max_workers = max_workers or len(self.teams)
+        self.report = None
         self.deadline_days = 60
         self.current_day = 0
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
         
-        print(f"INITIALIZING RAD PROJECT: {self.name}")
-        print("="*60)
-        print("Model: Rapid Application Development")
-        print("Constraints: STRICT 60-DAY DEADLINE")
-        print("Structure: 3 Parallel Teams")
-        print("="*60 + "\n")
-        time.sleep(2)
+        self._say(f"INITIALIZING RAD PROJECT: {self.name}")
+        self._say("="*60)
+        self._say("Model: Rapid Application Development")
+        self._say("Constraints: STRICT 60-DAY DEADLINE")
+        self._say(f"Structure: {len(self.teams)} Parallel Teams")
+        self._say("="*60 + "\n")
+        self.clock.sleep(2)
 
-    def _parallel_work(self, day, teams):
-        print(f"   [Day {day}] Parallel Sprint Status:")
-        for team, task in teams.items():
-            progress = random.choice([
-                "Building Prototype", "User Feedback Session", 
-                "Refining Component", "Automated Testing"
-                ])
-            print(f"    - {team}: {progress}...")
-        time.sleep(0.8)
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
+
+    def _parallel_work(self, day, teams, pool):
+        """
+        Runs one sprint: a step and a duration (mean 0.8 s) per team, worked
+        concurrently. Returns the durations and the sprint's makespan.
+        """
+        self._say(f"   [Day {day}] Parallel Sprint Status:")
+        durations = []
+        for team in teams:
+            progress = self.rng.choice(PROGRESS_STEPS)
+            durations.append(self.rng.uniform(0.4, 1.2))
+            self._say(f"    - {team}: {progress}...")
+        pause = getattr(self.clock, "pause", self.clock.sleep)
+        wait([pool.submit(pause, duration) for duration in durations])
+        makespan = _pool_makespan(durations, self.max_workers)
+        if hasattr(self.clock, "advance"):
+            self.clock.advance(makespan)
+        return durations, makespan
 
     def run(self):
         # Phase 1: Requirements Planning (Fast)
-        print("+--- PHASE 1: REQUIREMENTS PLANNING")
-        print("|    Gathering basic scope...")
-        time.sleep(1)
-        print("|    [OK] Scope Defined. Launching Parallel Teams.")
+        self.phases_visited.append("Requirements Planning")
+        self._say("+--- PHASE 1: REQUIREMENTS PLANNING")
+        self._say("|    Gathering basic scope...")
+        self.clock.sleep(1)
+        self._say("|    [OK] Scope Defined. Launching Parallel Teams.")
         self.current_day += 5
         
         # Phase 2 & 3: User Design & Construction (Combined & Parallel)
-        print("\n+--- PHASES 2 & 3: PARALLEL DESIGN & CONSTRUCTION")
-        teams = {
-            "Team UI": "Frontend",
-            "Team DB": "Database",
-            "Team API": "Logic"
-        }
+        self.phases_visited.append("User Design & Construction")
+        self._say("\n+--- PHASES 2 & 3: PARALLEL DESIGN & CONSTRUCTION")
+        durations, makespan = [], 0.0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while self.current_day < 55:
+                sprint, elapsed = self._parallel_work(self.current_day, self.teams, pool)
+                durations += sprint
+                makespan += elapsed
+                self.current_day += 10
+                
+                # Simulated User Feedback
+                self._say("    >> USER FEEDBACK: 'Change the button layout!' -> Teams Adapting...")
         
-        while self.current_day < 55:
-            self._parallel_work(self.current_day, teams)
-            self.current_day += 10
-            
-            # Simulated User Feedback
-            print("    >> USER FEEDBACK: 'Change the button layout!' -> Teams Adapting...")
+        # The last sprint's wait was the integration barrier
+        self.report = _team_report(len(self.teams), self.max_workers, durations, makespan)
+        self._say(f"    >> All {len(self.teams)} teams integrated: {self.report.makespan:.1f}s elapsed, "
+                  f"utilization {self.report.utilization:.0%}")
         
         # Phase 4: Cutover
-        print("\n+--- PHASE 4: CUTOVER")
-        print("|    Integrating Modules...")
-        time.sleep(1)
-        print("|    Data Migration...")
-        print("|    Final Testing...")
+        self.phases_visited.append("Cutover")
+        self._say("\n+--- PHASE 4: CUTOVER")
+        self._say("|    Integrating Modules...")
+        self.clock.sleep(1)
+        self._say("|    Data Migration...")
+        self._say("|    Final Testing...")
         
         if self.current_day <= self.deadline_days:
             remaining = self.deadline_days - self.current_day
-            print(f"\n[SUCCESS] Project Delivered ON TIME! ({remaining} days spare)")
+            self._say(f"\n[SUCCESS] Project Delivered ON TIME! ({remaining} days spare)")
+            self.outcome = "on_time"
         else:
-            print(f"\n[FAILURE] Project Overdue! RAD requires strict time management.")
+            self._say(f"\n[FAILURE] Project Overdue! RAD requires strict time management.")
+            self.outcome = "overdue"
+        return self.outcome
+
+def benchmark_team_pool(team_counts=(10, 100, 1000), max_workers=64, task_seconds=0.002,
+                        rng=random):
+    """
+    Runs one task per team (task_seconds +-50%, really slept) sequentially and
+    on a pool of 'max_workers' threads. Returns, per team count, the simulated
+    TeamReport and the measured wall-clock times and speedup.
+    """
+    rows = []
+    for teams in team_counts:
+        durations = [task_seconds * rng.uniform(0.5, 1.5) for _ in range(teams)]
+        start = time.perf_counter()
+        for duration in durations:
+            time.sleep(duration)
+        sequential = time.perf_counter() - start
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            wait([pool.submit(time.sleep, duration) for duration in durations])
+        parallel = time.perf_counter() - start
+        report = _team_report(teams, max_workers, durations, _pool_makespan(durations, max_workers))
+        rows.append((report, sequential, parallel, sequential / parallel))
+    return rows
 
 if __name__ == "__main__":
     project = RADProject("Internal Inventory Tool")
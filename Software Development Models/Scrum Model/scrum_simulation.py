@@ -2,8 +2,14 @@ import time
 import sys
 import os
 import random
+from collections import deque, namedtuple
 
-def daily_standup():
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_numeric import quantile
+
+def daily_standup(rng=random, clock=time):
     os.system('cls' if os.name == 'nt' else 'clear')
     print("SCRUM SIMULATION: The Daily Standup")
     print("="*60)
@@ -13,23 +19,23 @@ def daily_standup():
     print("2. What will you do today?")
     print("3. Are there any blockers?")
     print("="*60 + "\n")
-    time.sleep(2)
+    clock.sleep(2)
 
     team_members = ["Alice (Frontend)", "Bob (Backend)", "Charlie (QA)", "YOU (Fullstack)"]
     
     for member in team_members:
         print(f"\n--- {member}'s Turn ---")
-        time.sleep(1)
+        clock.sleep(1)
         
         if member == "YOU (Fullstack)":
             print("Your Request: Give your update.")
             print("(Simulation auto-filling for you...)")
-            time.sleep(1)
+            clock.sleep(1)
             print("YOU: \"Yesterday, I fixed the Login API.\"")
             print("     \"Today, I'm integrating the Payment Gateway.\"")
             
             # Random Chance of Blocker
-            if random.random() > 0.5:
+            if rng.random() > 0.5:
                 print("     \"BLOCKER: I'm waiting for the API Keys from the Client.\"")
                 print("\n[SCRUM MASTER]: \"Thanks. I'll email the client right now to unblock you.\"")
             else:
@@ -39,15 +45,122 @@ def daily_standup():
         else:
             # Random status for bots
             work = ["refactoring CSS", "optimizing DB", "writing test cases", "updating docs"]
-            print(f"{member.split()[0]}: \"Yesterday I was {random.choice(work)}.\"")
+            print(f"{member.split()[0]}: \"Yesterday I was {rng.choice(work)}.\"")
             print(f"          \"Today I am continuing that.\"")
             print("          \"No blockers.\"")
             
-        time.sleep(1.5)
+        clock.sleep(1.5)
     
     print("\n" + "="*60)
     print("STANDUP COMPLETE (Time: 12 minutes)")
     print("Everyone back to work!")
 
+# ------------------------------------------------------------------------------
+# Organisation-wide standups (discrete-event simulation)
+# ------------------------------------------------------------------------------
+# Every team holds the standup above once a day, starting somewhere in the
+# morning window. Each member talks for a few minutes and raises a blocker
+# with some probability. Blockers join one shared FIFO queue worked by a
+# limited pool of Scrum Masters. Time is in minutes. The events run on an
+# injected discrete-event clock (sim_clock.VirtualClock: call_at, call_later,
+# run), which jumps from event to event without sleeping.
+
+StandupReport = namedtuple(
+    "StandupReport",
+    "blockers wait_percentiles mean_wait max_wait resolution_percentiles "
+    "max_queue utilization minutes")
+
+class StandupSimulation:
+    """
+    'clock' is the discrete-event engine, e.g. sim_clock.VirtualClock().
+    teams x members standups per day for 'days' days. A member's turn lasts
+    uniform(turn_minutes) and raises a blocker with 'blocker_probability'
+    (default 1/8: one blocker every other standup of four, as above). Each of
+    the 'scrum_masters' resolves one blocker at a time, taking an exponential
+    time with mean 'resolution_minutes'.
+    """
+
+    DAY = 24 * 60
+
+    def __init__(self, clock, teams=500, members=4, days=5, scrum_masters=8,
+                 blocker_probability=0.125, resolution_minutes=30.0,
+                 turn_minutes=(2.0, 4.0), window_minutes=120.0, rng=random):
+        if scrum_masters < 1:
+            raise ValueError("At least one Scrum Master is needed")
+        self.teams = teams
+        self.members = members
+        self.days = days
+        self.scrum_masters = scrum_masters
+        self.blocker_probability = blocker_probability
+        self.resolution_minutes = resolution_minutes
+        self.turn_minutes = turn_minutes
+        self.window_minutes = window_minutes
+        self.rng = rng
+        self.clock = clock
+
+        self.queue = deque()      # arrival times of waiting blockers
+        self.idle = scrum_masters
+        self.busy_minutes = 0.0
+        self.max_queue = 0
+        self.waits = []
+        self.resolutions = []
+
+    def _standup(self):
+        """Runs one team's turns; blockers arrive as their turn ends."""
+        low, high = self.turn_minutes
+        uniform = self.rng.uniform
+        draw = self.rng.random
+        t = 0.0
+        for _ in range(self.members):
+            t += uniform(low, high)
+            if draw() < self.blocker_probability:
+                self.clock.call_later(t, self._blocker_raised)
+
+    def _blocker_raised(self):
+        now = self.clock.now()
+        if self.idle:
+            self.idle -= 1
+            self._start_resolution(now)
+        else:
+            self.queue.append(now)
+            self.max_queue = max(self.max_queue, len(self.queue))
+
+    def _start_resolution(self, arrived):
+        duration = self.rng.expovariate(1.0 / self.resolution_minutes)
+        self.waits.append(self.clock.now() - arrived)
+        self.busy_minutes += duration
+        self.clock.call_later(duration, self._blocker_resolved, arrived)
+
+    def _blocker_resolved(self, arrived):
+        self.resolutions.append(self.clock.now() - arrived)
+        if self.queue:
+            self._start_resolution(self.queue.popleft())
+        else:
+            self.idle += 1
+
+    def run(self, quantiles=(0.5, 0.9, 0.95, 0.99)):
+        uniform = self.rng.uniform
+        start = self.clock.now()
+        for day in range(self.days):
+            for _ in range(self.teams):
+                self.clock.call_at(start + day * self.DAY + uniform(0.0, self.window_minutes),
+                                   self._standup)
+        self.clock.run()
+        minutes = self.clock.now() - start
+
+        waits = sorted(self.waits)
+        resolutions = sorted(self.resolutions)
+        if not waits:
+            return StandupReport(0, {}, 0.0, 0.0, {}, 0, 0.0, minutes)
+        return StandupReport(
+            len(waits),
+            {q: quantile(waits, q) for q in quantiles},
+            sum(waits) / len(waits),
+            waits[-1],
+            {q: quantile(resolutions, q) for q in quantiles},
+            self.max_queue,
+            self.busy_minutes / (self.scrum_masters * max(minutes, self.days * self.DAY)),
+            minutes)
+
 if __name__ == "__main__":
     daily_standup()
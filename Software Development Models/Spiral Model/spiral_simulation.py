@@ -2,6 +2,22 @@ import time
 import sys
 import os
 import random
+from collections import namedtuple
+from itertools import accumulate
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)  # shared sim_* modules
+from sim_random import batched
+
+# (objective, estimated risk[, cost]) of each loop of the demo project.
+# Without a cost, loop k costs k budget units (each loop grows in fidelity).
+DEFAULT_SPIRALS = [
+    ("Concept of Operations", 0.2),
+    ("Requirements Definition", 0.3),
+    ("High-Level Design", 0.4),
+    ("Final Implementation", 0.1),
+]
 
 class SpiralProject:
     """
@@ -10,82 +26,169 @@ class SpiralProject:
     The project proceeds in loops (Spirals).
     """
     
-    def __init__(self, name):
+    def __init__(self, name, rng=random, clock=time, headless=False):
         self.name = name
+        self.rng = rng
+        self.clock = clock
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
         self.spiral_count = 1
         self.budget_spent = 0
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
         
-        print(f"INITIALIZING SPIRAL MODEL PROJECT: {self.name}")
-        print("="*60)
-        print("This simulation focuses on RISK ANALYSIS.")
-        print("Each loop (Spiral) increases in cost and fidelity.")
-        print("If Risk Analysis fails, the project can be TERMINATED.")
-        print("="*60 + "\n")
-        time.sleep(2)
+        self._say(f"INITIALIZING SPIRAL MODEL PROJECT: {self.name}")
+        self._say("="*60)
+        self._say("This simulation focuses on RISK ANALYSIS.")
+        self._say("Each loop (Spiral) increases in cost and fidelity.")
+        self._say("If Risk Analysis fails, the project can be TERMINATED.")
+        self._say("="*60 + "\n")
+        self.clock.sleep(2)
+
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
 
     def _print_quadrant(self, quadrant, message):
-        print(f"[SPIRAL {self.spiral_count} - {quadrant}]")
-        print(f"   >> {message}")
-        time.sleep(0.8)
-
-    def run_spiral(self, objective, estimated_risk):
-        print(f"\n" + "="*40)
-        print(f"STARTING SPIRAL {self.spiral_count}: {objective}")
-        print("="*40)
+        self._say(f"[SPIRAL {self.spiral_count} - {quadrant}]")
+        self._say(f"   >> {message}")
+        self.clock.sleep(0.8)
+
+    def run_spiral(self, objective, estimated_risk, cost=None):
+        self.phases_visited.append(objective)
+        self.budget_spent += self.spiral_count if cost is None else cost
+        self._say(f"\n" + "="*40)
+        self._say(f"STARTING SPIRAL {self.spiral_count}: {objective}")
+        self._say("="*40)
         
         # Quadrant 1: Objectives
         self._print_quadrant("planning", "Determining objectives and constraints...")
         self._print_quadrant("planning", "Identifying alternative solutions...")
 
         # Quadrant 2: Risk Analysis (CRITICAL)
-        print("\n   [!] ENTERING RISK ANALYSIS SECTOR...")
-        time.sleep(1)
-        simulated_risk_val = random.random()
+        self._say("\n   [!] ENTERING RISK ANALYSIS SECTOR...")
+        self.clock.sleep(1)
+        simulated_risk_val = self.rng.random()
         
         # We simulate a prototype creation to mitigate risk
         self._print_quadrant("risk_analysis", f"Building Prototype v{self.spiral_count}.0 to test feasibility...")
         
         if simulated_risk_val < estimated_risk:
             # Risk Realized
-            print(f"\n   [X] CRITICAL RISK DETECTED in Spiral {self.spiral_count}!")
-            print(f"       Risk Factor: {simulated_risk_val:.2f} (Threshold: {estimated_risk})")
-            print("       The prototype failed to validate the core assumptions.")
+            self._say(f"\n   [X] CRITICAL RISK DETECTED in Spiral {self.spiral_count}!")
+            self._say(f"       Risk Factor: {simulated_risk_val:.2f} (Threshold: {estimated_risk})")
+            self._say("       The prototype failed to validate the core assumptions.")
             
-            print("\n   [?] DECISION POINT: Can we mitigate this?")
-            time.sleep(1)
-            if random.random() > 0.5:
-                print("   >> Mitigation plan formulated. Proceeding with CAUTION.")
+            self._say("\n   [?] DECISION POINT: Can we mitigate this?")
+            self.clock.sleep(1)
+            if self.rng.random() > 0.5:
+                self._say("   >> Mitigation plan formulated. Proceeding with CAUTION.")
             else:
-                print("   >> Mitigation IMPOSSIBLE. Technology is not mature enough.")
-                print("\n   [X] PROJECT TERMINATED DUE TO HIGH RISK.")
+                self._say("   >> Mitigation IMPOSSIBLE. Technology is not mature enough.")
+                self._say("\n   [X] PROJECT TERMINATED DUE TO HIGH RISK.")
+                self.outcome = "terminated"
                 return False
         else:
-            print("   >> Risk Analysis PASSED. Prototype validated.")
+            self._say("   >> Risk Analysis PASSED. Prototype validated.")
 
         # Quadrant 3: Engineering
-        print("")
+        self._say("")
         self._print_quadrant("engineering", "Developing concept/code...")
         self._print_quadrant("engineering", "Testing deliverables...")
         
         # Quadrant 4: Evaluation
-        print("")
+        self._say("")
         self._print_quadrant("evaluation", "Customer evaluating current build...")
         self._print_quadrant("evaluation", "Planning next Spiral...")
         
         self.spiral_count += 1
         return True
 
+    def run(self, spirals=DEFAULT_SPIRALS):
+        """Runs the loops in order until one is terminated; returns the outcome."""
+        for stage in spirals:
+            if not self.run_spiral(*stage):
+                return self.outcome
+        self.outcome = "completed"
+        return self.outcome
+
+# ------------------------------------------------------------------------------
+# Outcome estimators
+# ------------------------------------------------------------------------------
+# In run_spiral a loop is terminated when its risk is realised (probability
+# 'risk') and mitigation then fails (probability 1/2). Loops are independent,
+# so a plan is a chain of Bernoulli trials with termination probabilities
+# q_k = risk_k / 2, and the loop a run stops in determines everything else:
+#
+#     P(reach loop k) = prod_{j<k} (1 - q_j)       P(complete) = prod_k (1 - q_k)
+#     budget spent    = cost_1 + ... + cost_k      when the run stops in loop k
+
+SpiralEstimate = namedtuple(
+    "SpiralEstimate",
+    "completion_probability expected_spirals spiral_distribution budget_distribution "
+    "expected_budget runs")
+
+def _termination_probabilities(stages):
+    return [min(max(stage[1], 0.0), 1.0) * 0.5 for stage in stages]
+
+def _stage_costs(stages):
+    return [stage[2] if len(stage) > 2 else k for k, stage in enumerate(stages, start=1)]
+
+def _estimate(stages, stop_probabilities, completion_probability, runs):
+    """Builds the estimate from P(run stops in loop k), k = 1..n."""
+    budget = {}
+    for spent, probability in zip(accumulate(_stage_costs(stages)), stop_probabilities):
+        budget[spent] = budget.get(spent, 0.0) + probability
+    return SpiralEstimate(
+        completion_probability,
+        sum(k * p for k, p in enumerate(stop_probabilities, start=1)),
+        stop_probabilities,
+        budget,
+        sum(spent * p for spent, p in budget.items()),
+        runs)
+
+def spiral_outcome_exact(stages=DEFAULT_SPIRALS):
+    """
+    Exact SpiralEstimate of a plan of (objective, risk[, cost]) stages.
+    spiral_distribution[k-1] is the probability that the run ends in loop k
+    (terminated there, or, for the last loop, terminated or completed).
+    """
+    if not stages:
+        raise ValueError("A spiral plan needs at least one stage")
+    q = _termination_probabilities(stages)
+    stops = []
+    reach = 1.0
+    for q_k in q[:-1]:
+        stops.append(reach * q_k)
+        reach *= 1.0 - q_k
+    stops.append(reach)
+    return _estimate(stages, stops, reach * (1.0 - q[-1]), None)
+
+def estimate_spiral_outcomes(stages=DEFAULT_SPIRALS, runs=10**6, rng=random):
+    """
+    Monte Carlo SpiralEstimate over 'runs' projects. All runs advance through
+    the plan together: per loop, only the number of runs still alive is kept
+    and one uniform draw per alive run decides its termination.
+    """
+    if not stages:
+        raise ValueError("A spiral plan needs at least one stage")
+    bernoullis = batched(rng).bernoullis
+    q = _termination_probabilities(stages)
+    alive = runs
+    stopped = []
+    for q_k in q[:-1]:
+        terminated = sum(bernoullis(alive, q_k))
+        stopped.append(terminated)
+        alive -= terminated
+    stopped.append(alive)
+    completed = alive - sum(bernoullis(alive, q[-1]))
+    return _estimate(stages, [count / runs for count in stopped], completed / runs, runs)
+
 if __name__ == "__main__":
     project = SpiralProject("Autonomous Drone Navigation System")
     
-    # Spiral 1: Feasibility
-    if project.run_spiral("Concept of Operations", estimated_risk=0.2):
-        # Spiral 2: Requirements
-        if project.run_spiral("Requirements Definition", estimated_risk=0.3):
-             # Spiral 3: Design
-            if project.run_spiral("High-Level Design", estimated_risk=0.4):
-                # Spiral 4: Implementation
-                if project.run_spiral("Final Implementation", estimated_risk=0.1):
-                    print("\n" + "="*60)
-                    print("PROJECT COMPLETED SUCCESSFULLY THROUGH ALL SPIRALS")
+    # Feasibility -> Requirements -> Design -> Implementation
+    if project.run() == "completed":
+        print("\n" + "="*60)
+        print("PROJECT COMPLETED SUCCESSFULLY THROUGH ALL SPIRALS")
@@ -1,6 +1,45 @@
 import time
-import sys
 import os
+import heapq
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Tasks of each phase, in order. Every task takes 0.5 s, plus 0.5 s for the sign-off.
+PHASE_TASKS = {
+    "Requirements Analysis": [
+        "Conducting stakeholder interviews",
+        "Analysing user needs",
+        "Drafting Requirement Specification (SRS)",
+        "Formal Sign-off",
+    ],
+    "System Design": [
+        "Creating High-Level Architecture",
+        " designing Database Schema",
+        "Defining Interfaces (SDD)",
+        "Design Review",
+    ],
+    "Implementation": [
+        "Writing Code",
+        "Unit Testing Modules",
+        "Code Review",
+    ],
+    "Verification": [
+        "Integration Testing",
+        "System Testing",
+        "Fixing Bugs",
+        "User Acceptance Testing (UAT)",
+    ],
+    "Deployment": [
+        "Server Configuration",
+        "Deploying to Production",
+        "Sanity Check",
+    ],
+    "Maintenance": [
+        "Monitoring System",
+        "Handling User Feedback",
+        "Patching Security Issues",
+    ],
+}
 
 class WaterfallProject:
     """
@@ -9,154 +48,261 @@ class WaterfallProject:
     Visualizes the 'Waterfall' flow in the console.
     """
     
-    def __init__(self, name):
+    def __init__(self, name, clock=time, headless=False):
         self.name = name
-        self.phases = [
-            "Requirements Analysis",
-            "System Design",
-            "Implementation",
-            "Verification",
-            "Deployment",
-            "Maintenance"
-        ]
+        self.clock = clock
+        self.headless = headless
+        self.phases_visited = []
+        self.outcome = None
+        self.phases = list(PHASE_TASKS)
+        self.scheduler = self.phase_scheduler()  # dependency index
         self.completed_phases = []
+        self.completed = set()
         self.indent_level = 0
         
         # Clear screen for better visualization
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
         
-        print(f"INITIALIZING WATERFALL PROJECT: {self.name}")
-        print("="*60)
-        print("The Waterfall model dictates that each phase must be completed")
-        print("fully before the next phase can begin. There is no overlapping.")
-        print("="*60 + "\n")
+        self._say(f"INITIALIZING WATERFALL PROJECT: {self.name}")
+        self._say("="*60)
+        self._say("The Waterfall model dictates that each phase must be completed")
+        self._say("fully before the next phase can begin. There is no overlapping.")
+        self._say("="*60 + "\n")
+
+    def _say(self, *args, **kwargs):
+        if not self.headless:
+            print(*args, **kwargs)
 
     def _print_waterfall_step(self, phase_name, status):
         """Helper to print the visual cascading effect"""
         indent = " " * (self.indent_level * 6)
         
         if status == "START":
-            print(f"{indent}+--- [PHASE {self.indent_level + 1}: {phase_name.upper()}]")
-            print(f"{indent}|    Status: IN PROGRESS...")
+            self._say(f"{indent}+--- [PHASE {self.indent_level + 1}: {phase_name.upper()}]")
+            self._say(f"{indent}|    Status: IN PROGRESS...")
         elif status == "WORK":
             # Just vertical lines for previous levels to show continuity if we wanted, 
             # but for waterfall, we just focus on current block.
             pass
         elif status == "DONE":
-            print(f"{indent}|    Status: COMPLETED (Signed Off)")
-            print(f"{indent}V") 
+            self._say(f"{indent}|    Status: COMPLETED (Signed Off)")
+            self._say(f"{indent}V") 
 
-    def _simulate_work(self, tasks, phase_name):
+    def _simulate_work(self, tasks, phase_name, sleep):
+        self.phases_visited.append(phase_name)
         self._print_waterfall_step(phase_name, "START")
         
         indent = " " * (self.indent_level * 6)
         prefix = f"{indent}|    "
         
         for task in tasks:
-            print(f"{prefix}* {task}...", end="")
-            sys.stdout.flush()
-            time.sleep(0.5) # Simulating work
-            print(" DONE")
+            self._say(f"{prefix}* {task}...", end="", flush=True)
+            sleep(0.5) # Simulating work
+            self._say(" DONE")
             
         self._print_waterfall_step(phase_name, "DONE")
         
         self.completed_phases.append(phase_name)
+        self.completed.add(phase_name)
         self.indent_level += 1
-        time.sleep(0.5)
+        sleep(0.5)
+
+    def run_phase(self, phase, sleep=None):
+        """
+        Runs one phase if the scheduler's dependency index has all of its
+        prerequisites signed off; otherwise the project is blocked.
+        'sleep' paces the tasks (default: self.clock.sleep).
+        """
+        missing = [p for p in self.scheduler.prerequisites(phase) if p not in self.completed]
+        if missing:
+            self._say(f"ERROR: Cannot start {phase}. {', '.join(missing)} not done!")
+            self.outcome = "blocked"
+            return
+
+        self._simulate_work(PHASE_TASKS[phase], phase, sleep or self.clock.sleep)
+        if len(self.completed) == len(self.phases):
+            self.outcome = "completed"
+            
+            self._say("\n" + "="*60)
+            self._say("PROJECT LIFECYCLE COMPLETED SUCCESSFULLY")
+            self._say("Notice how the process flowed downwards like a waterfall?")
+            self._say("="*60)
 
     def run_requirements(self):
-        phase_name = "Requirements Analysis"
-        tasks = [
-            "Conducting stakeholder interviews",
-            "Analysing user needs",
-            "Drafting Requirement Specification (SRS)",
-            "Formal Sign-off"
-        ]
-        self._simulate_work(tasks, phase_name)
+        self.run_phase("Requirements Analysis")
 
     def run_design(self):
-        # Strict Dependency Check
-        if "Requirements Analysis" not in self.completed_phases:
-            print("ERROR: Cannot start Design. Requirements Analysis not done!")
-            return
-
-        phase_name = "System Design"
-        tasks = [
-            "Creating High-Level Architecture",
-            " designing Database Schema",
-            "Defining Interfaces (SDD)",
-            "Design Review"
-        ]
-        self._simulate_work(tasks, phase_name)
+        self.run_phase("System Design")
 
     def run_implementation(self):
-        if "System Design" not in self.completed_phases:
-            print("ERROR: Cannot start Implementation. Design not done!")
-            return
-
-        phase_name = "Implementation"
-        tasks = [
-            "Writing Code",
-            "Unit Testing Modules",
-            "Code Review"
-        ]
-        self._simulate_work(tasks, phase_name)
+        self.run_phase("Implementation")
 
     def run_verification(self):
-        if "Implementation" not in self.completed_phases:
-            print("ERROR: Cannot start Verification. Implementation not done!")
-            return
-
-        phase_name = "Verification"
-        tasks = [
-            "Integration Testing",
-            "System Testing",
-            "Fixing Bugs",
-            "User Acceptance Testing (UAT)"
-        ]
-        self._simulate_work(tasks, phase_name)
+        self.run_phase("Verification")
 
     def run_deployment(self):
-        if "Verification" not in self.completed_phases:
-            print("ERROR: Cannot start Deployment. Verification not done!")
-            return
-
-        phase_name = "Deployment"
-        tasks = [
-            "Server Configuration",
-            "Deploying to Production",
-            "Sanity Check"
-        ]
-        self._simulate_work(tasks, phase_name)
+        self.run_phase("Deployment")
 
     def run_maintenance(self):
-        if "Deployment" not in self.completed_phases:
-            print("ERROR: Cannot start Maintenance. Deployment not done!")
-            return
+        self.run_phase("Maintenance")
 
-        phase_name = "Maintenance"
-        tasks = [
-            "Monitoring System",
-            "Handling User Feedback",
-            "Patching Security Issues"
-        ]
-        self._simulate_work(tasks, phase_name)
-        
-        print("\n" + "="*60)
-        print("PROJECT LIFECYCLE COMPLETED SUCCESSFULLY")
-        print("Notice how the process flowed downwards like a waterfall?")
-        print("="*60)
+    def phase_scheduler(self):
+        """This project's phases as a PhaseScheduler chain, with their pacing."""
+        durations = {phase: 0.5 * len(PHASE_TASKS[phase]) + 0.5 for phase in self.phases}
+        return PhaseScheduler.chain(self.phases, durations)
+
+    def run(self):
+        """Runs every phase in dependency order, one at a time; returns the outcome."""
+        self.scheduler.run(self.run_phase, max_workers=1, clock=self.clock)
+        return self.outcome
+
+# ------------------------------------------------------------------------------
+# Phase-graph scheduler
+# ------------------------------------------------------------------------------
+# Real delivery plans are DAGs of phases and tasks rather than one chain.
+# The graph is indexed once: names map to integer ids, prerequisites are
+# kept as sets and the topological order is computed when the scheduler is
+# built. Each task starts as soon as all of its prerequisites are done.
+
+Schedule = namedtuple("Schedule", "completion_order finish_times critical_path duration")
+
+class PhaseScheduler:
+    """
+    durations:    {task: simulated seconds}
+    dependencies: {task: prerequisite tasks} (tasks without an entry are roots)
+    """
+
+    def __init__(self, durations, dependencies=None):
+        dependencies = dependencies or {}
+        self.names = list(durations)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.durations = [float(durations[name]) for name in self.names]
+        self.predecessors = [set() for _ in self.names]
+        self.successors = [[] for _ in self.names]
+        for name, prerequisites in dependencies.items():
+            if name not in self.index:
+                raise ValueError(f"Unknown task '{name}' in dependencies")
+            for prerequisite in prerequisites:
+                if prerequisite not in self.index:
+                    raise ValueError(f"'{name}' depends on unknown task '{prerequisite}'")
+                self.predecessors[self.index[name]].add(self.index[prerequisite])
+        for i, prerequisites in enumerate(self.predecessors):
+            for j in prerequisites:
+                self.successors[j].append(i)
+        self.order = self._topological_order()
+
+    @classmethod
+    def chain(cls, phases, durations):
+        """Classic waterfall: every phase depends on the one before it."""
+        return cls(durations, {phase: [previous] for previous, phase in zip(phases, phases[1:])})
+
+    def _topological_order(self):
+        pending = [len(p) for p in self.predecessors]
+        ready = deque(i for i, count in enumerate(pending) if count == 0)
+        order = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for j in self.successors[i]:
+                pending[j] -= 1
+                if pending[j] == 0:
+                    ready.append(j)
+        if len(order) != len(self.names):
+            raise ValueError("The phase graph has a dependency cycle")
+        return order
+
+    def prerequisites(self, name):
+        """Names of the tasks 'name' directly depends on."""
+        return [self.names[j] for j in sorted(self.predecessors[self.index[name]])]
+
+    def is_ready(self, name, completed):
+        """True if every prerequisite of 'name' is in the set 'completed'."""
+        return all(self.names[j] in completed for j in self.predecessors[self.index[name]])
+
+    def plan(self, max_workers=None):
+        """
+        Earliest finish times and the critical path. With 'max_workers' a task
+        that is ready also waits for a free worker; tasks are served in the
+        order they become ready, like the thread pool in run(). A task that
+        starts late for want of a worker has the task that freed the worker
+        before it on the critical path, so the path always spans the duration.
+        """
+        finish = [0.0] * len(self.names)
+        via = [None] * len(self.names)  # task whose finish released it last
+        position = {i: k for k, i in enumerate(self.order)}
+        pending = [len(p) for p in self.predecessors]
+        ready = [(0.0, position[i], i) for i in self.order if pending[i] == 0]
+        heapq.heapify(ready)
+        free = [(0.0, -1)] * max_workers if max_workers else None  # (free at, freed by)
+        while ready:
+            start, _, i = heapq.heappop(ready)
+            if free is not None:
+                free_at, freed_by = heapq.heappop(free)
+                if free_at > start:
+                    start, via[i] = free_at, freed_by
+            finish[i] = start + self.durations[i]
+            if free is not None:
+                heapq.heappush(free, (finish[i], i))
+            for j in self.successors[i]:
+                if via[j] is None or finish[i] > finish[via[j]]:
+                    via[j] = i
+                pending[j] -= 1
+                if pending[j] == 0:
+                    heapq.heappush(ready, (finish[via[j]], position[j], j))
+        if not finish:
+            return Schedule([], {}, [], 0.0)
+        last = max(range(len(finish)), key=finish.__getitem__)
+        path = []
+        while last is not None:
+            path.append(self.names[last])
+            last = via[last]
+        completion = sorted(self.order, key=lambda i: (finish[i], position[i]))
+        return Schedule([self.names[i] for i in completion],
+                        {self.names[i]: finish[i] for i in range(len(finish))},
+                        path[::-1], max(finish))
+
+    def run(self, work=None, max_workers=None, clock=time):
+        """
+        Executes the tasks on a pool of 'max_workers' threads (default: one
+        per task). Independent tasks run side by side; a task is submitted as
+        soon as its last prerequisite completes.
+
+        work(name, pause) does the task (default: pause for its duration) and
+        paces itself with pause(seconds), which blocks the worker thread but
+        leaves the shared clock alone (clock.pause; time.sleep for the 'time'
+        module). The clock then advances once, by the planned makespan.
+        Returns that Schedule with the actual completion order.
+        """
+        if work is None:
+            work = lambda name, pause: pause(self.durations[self.index[name]])
+        workers = max_workers or max(len(self.names), 1)
+        pause = getattr(clock, "pause", clock.sleep)
+        pending = [len(p) for p in self.predecessors]
+        completed = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {pool.submit(work, self.names[i], pause): i
+                       for i in self.order if pending[i] == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    future.result()
+                    completed.append(self.names[i])
+                    for j in self.successors[i]:
+                        pending[j] -= 1
+                        if pending[j] == 0:
+                            running[pool.submit(work, self.names[j], pause)] = j
+        schedule = self.plan(workers)
+        if hasattr(clock, "advance"):
+            clock.advance(schedule.duration)
+        return schedule._replace(completion_order=completed)
 
 if __name__ == "__main__":
     project = WaterfallProject("NextGen Banking System")
     
     try:
-        project.run_requirements()
-        project.run_design()
-        project.run_implementation()
-        project.run_verification()
-        project.run_deployment()
-        project.run_maintenance()
+        project.run()
     except Exception as e:
         print(f"An error occurred: {e}")
 
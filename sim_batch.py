@@ -0,0 +1,101 @@
+"""
+Headless Batch Runner for the Development-Model Simulations
+===========================================================
+The classes in 'Software Development Models/' accept headless=True: they
+then skip the terminal clear and all printing. Paired with a VirtualClock
+and a seeded stream, a run takes well under a millisecond, so thousands of
+projects can be simulated per second in CI or analytics jobs.
+
+    result = run_headless("spiral", RandomStreams(7).stream())
+    result.outcome          # "completed" or "terminated"
+    result.phases           # ("Concept of Operations", "Requirements Definition", ...)
+    result.duration         # simulated seconds the interactive run would pace out
+
+    results = run_batch("iterative", 10000, seed=1)      # reproducible, on all cores
+    summarize(results)
+"""
+
+import random
+from collections import Counter, namedtuple
+from functools import partial
+from statistics import fmean
+
+from sim_clock import VirtualClock
+from sim_loader import load_script
+from sim_random import map_replicas
+
+SimulationResult = namedtuple("SimulationResult", "model phases outcome duration")
+
+# model -> (module name, script path, class name, constructor arguments, uses rng)
+MODELS = {
+    "waterfall": ("waterfall_simulation", "Software Development Models/Waterfall Model/waterfall_simulation.py",
+                  "WaterfallProject", ("Batch Project",), False),
+    "spiral": ("spiral_simulation", "Software Development Models/Spiral Model/spiral_simulation.py",
+               "SpiralProject", ("Batch Project",), True),
+    "rad": ("rad_simulation", "Software Development Models/Rapid Application Development Model/rad_simulation.py",
+            "RADProject", ("Batch Project",), True),
+    "agile": ("agile_simulation", "Software Development Models/Agile Development Models/agile_simulation.py",
+              "AgileSprint", ("Batch Project",), True),
+    "iterative": ("iterative_simulation", "Software Development Models/Iterative Waterfall Model/iterative_simulation.py",
+                  "IterativeWaterfallProject", ("Batch Project",), True),
+    "prototype": ("prototype_simulation", "Software Development Models/Prototype Model/prototype_simulation.py",
+                  "PrototypeSimulation", (), False),
+    "xp": ("xp_simulation", "Software Development Models/Extreme Programming/xp_simulation.py",
+           "XPSimulation", (), False),
+    "v_model": ("v_model_simulation", "Software Development Models/SDLC V-Model/v_model_simulation.py",
+                "VModelProject", (), False),
+}
+
+def model_class(model):
+    module_name, path, class_name, _, _ = MODELS[model]
+    return getattr(load_script(module_name, path), class_name)
+
+def run_headless(model, rng=random, **run_kwargs):
+    """
+    Runs one project of 'model' (a MODELS key) silently on a VirtualClock and
+    returns its SimulationResult. run_kwargs go to the project's run().
+    """
+    _, _, _, args, uses_rng = MODELS[model]
+    clock = VirtualClock()
+    kwargs = {"clock": clock, "headless": True}
+    if uses_rng:
+        kwargs["rng"] = rng
+    project = model_class(model)(*args, **kwargs)
+    project.run(**run_kwargs)
+    return SimulationResult(model, tuple(project.phases_visited), project.outcome, clock.now())
+
+def _run_replica(model, run_kwargs, rng, index):
+    return run_headless(model, rng, **run_kwargs)
+
+def run_batch(model, count, seed=None, processes=None, chunk_size=10000, **run_kwargs):
+    """
+    'count' independent headless runs, in replica order. Run i draws from
+    RandomStreams(seed).replica(i), so a seeded batch is reproducible for any
+    number of processes (processes=1 runs inline).
+    """
+    return map_replicas(partial(_run_replica, model, run_kwargs), count,
+                        seed=seed, processes=processes, chunk_size=chunk_size)
+
+def summarize(results):
+    """Outcome counts plus mean phase count and simulated duration."""
+    return {
+        "runs": len(results),
+        "outcomes": dict(Counter(r.outcome for r in results)),
+        "mean_phases": fmean(len(r.phases) for r in results),
+        "mean_duration": fmean(r.duration for r in results),
+    }
+
+def run_simulation():
+    print("=========================================")
+    print("   HEADLESS DEVELOPMENT-MODEL BATCH      ")
+    print("=========================================")
+    print(f"{'Model':<10} | {'Runs':>6} | {'Phases':>6} | {'Sim. secs':>9} | Outcomes")
+    print("-" * 70)
+    for model in MODELS:
+        summary = summarize(run_batch(model, 1000, seed=2024, processes=1))
+        outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(summary["outcomes"].items()))
+        print(f"{model:<10} | {summary['runs']:>6} | {summary['mean_phases']:>6.2f} | "
+              f"{summary['mean_duration']:>9.1f} | {outcomes}")
+
+if __name__ == "__main__":
+    run_simulation()
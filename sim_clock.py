@@ -0,0 +1,110 @@
+"""
+Pluggable Clocks for the Simulations
+====================================
+The simulations pace themselves with 'clock.sleep(seconds)'. They accept a
+'clock' argument that defaults to the 'time' module, so interactive runs keep
+their usual pacing. Batch runs can pass one of these instead:
+
+    RealClock()            blocks for the real duration (same as 'time')
+    AcceleratedClock(60)   runs 60x faster than real time
+    VirtualClock()         never blocks: time only advances on paper
+
+Every clock counts the simulated seconds that have passed in 'now()', so a
+batch run can still report how long the simulated work would have taken.
+
+sleep(seconds) is advance(seconds), which only counts, plus pause(seconds),
+which only blocks. Work that runs on several threads at once pauses in the
+worker threads and lets the coordinating thread advance the clock once by
+the elapsed (makespan) time, so the threads never share the clock's state
+and the clock does not count their work twice. pause() is a no-op on a
+VirtualClock; with the 'time' module as the clock, use time.sleep.
+
+VirtualClock is also a small discrete-event scheduler. call_at/call_later
+queue callbacks on a heap, and run() executes them in time order, jumping
+the clock straight from one event to the next.
+"""
+
+import heapq
+import itertools
+import time
+
+class RealClock:
+    """Wall-clock pacing, with the simulated time tracked in now()."""
+
+    def __init__(self):
+        self._elapsed = 0.0
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+        self.pause(seconds)
+
+    def advance(self, seconds):
+        self._elapsed += seconds
+
+    def pause(self, seconds):
+        time.sleep(seconds)
+
+    def now(self):
+        return self._elapsed
+
+class AcceleratedClock(RealClock):
+    """Sleeps for seconds / factor of real time (factor=60: 1 min -> 1 s)."""
+
+    def __init__(self, factor):
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+        super().__init__()
+        self.factor = factor
+
+    def pause(self, seconds):
+        time.sleep(seconds / self.factor)
+
+class VirtualClock:
+    """
+    Instant clock: sleep() only advances the simulated time.
+
+    Works as a discrete-event engine too:
+        clock.call_later(5, callback, *args)
+        clock.run()            # runs events in time order
+    """
+
+    def __init__(self, start=0.0):
+        self._time = start
+        self._events = []
+        self._sequence = itertools.count()  # keeps FIFO order for equal times
+
+    def sleep(self, seconds):
+        self._time += seconds
+
+    advance = sleep
+
+    def pause(self, seconds):
+        pass
+
+    def now(self):
+        return self._time
+
+    def call_at(self, when, callback, *args):
+        heapq.heappush(self._events, (when, next(self._sequence), callback, args))
+
+    def call_later(self, delay, callback, *args):
+        self.call_at(self._time + delay, callback, *args)
+
+    def pending(self):
+        return len(self._events)
+
+    def step(self):
+        """Runs the next event; returns False when none is left."""
+        if not self._events:
+            return False
+        when, _, callback, args = heapq.heappop(self._events)
+        self._time = max(self._time, when)
+        callback(*args)
+        return True
+
+    def run(self, until=None):
+        """Runs events in order (up to time 'until', if given)."""
+        while self._events and (until is None or self._events[0][0] <= until):
+            self.step()
+        if until is not None:
+            self._time = max(self._time, until)
@@ -0,0 +1,33 @@
+"""
+Loading the Simulation Scripts
+==============================
+The simulations live in folders whose names contain spaces, so they are not
+packages and cannot be imported the usual way. load_script imports one by
+path instead:
+
+    waterfall = load_script("waterfall_simulation",
+                            "Software Development Models/Waterfall Model/waterfall_simulation.py")
+
+Relative paths are resolved against 'base' (default: the repository root).
+A loaded script is registered in sys.modules under 'module_name', so it is
+executed only once and worker processes can unpickle objects defined in it.
+
+Scripts below the root that use the shared sim_* modules put the root on
+sys.path first, as model_registry.py does.
+"""
+
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def load_script(module_name, path, base=ROOT):
+    """Imports the script at 'path' (relative to 'base') as 'module_name'."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(base, path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # lets worker processes unpickle its objects
+    spec.loader.exec_module(module)
+    return module
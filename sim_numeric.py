@@ -0,0 +1,78 @@
+"""
+Numeric Helpers for the Simulations
+===================================
+Small pieces of numerics shared by several simulation scripts.
+
+broadcast_params: the reliability models evaluate over a whole time grid and
+several parameter sets at once. Each parameter may be a number or a sequence
+(one entry per parameter set); sequences must have equal lengths, and numbers
+are repeated to match them, like NumPy broadcasting:
+
+    broadcast_params(100, [0.1, 0.2])   -> [[100.0, 100.0], [0.1, 0.2]]
+    broadcast_params(100, 0.1)          -> None (all scalars)
+
+quantile: summaries of Monte Carlo runs (linear interpolation between the
+two nearest order statistics, NumPy's default). nearest_rank returns an
+observed value instead (the ceil(q * n)-th smallest), for counts such as
+sprints that should stay whole or values that are not numbers at all.
+
+find_root: safeguarded Newton for the reliability-model solvers (fitting,
+time to a target), which all bracket their root before refining it.
+"""
+
+import math
+import numbers
+
+def is_scalar(x):
+    return isinstance(x, numbers.Real)
+
+def broadcast_params(*values):
+    """Returns equal-length lists for the given values, or None if all are scalars."""
+    if all(is_scalar(v) for v in values):
+        return None
+    columns = [[float(v)] if is_scalar(v) else [float(x) for x in v] for v in values]
+    size = max(len(c) for c in columns)
+    for k, column in enumerate(columns):
+        if len(column) == 1:
+            columns[k] = column * size
+        elif len(column) != size:
+            raise ValueError(f"Cannot broadcast parameter sequences of lengths "
+                             f"{[len(c) for c in columns]}")
+    return columns
+
+def quantile(sorted_values, q):
+    """Linear-interpolation quantile of an already sorted list."""
+    position = q * (len(sorted_values) - 1)
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+def nearest_rank(sorted_values, q):
+    """Nearest-rank quantile of an already sorted list: the ceil(q * n)-th value."""
+    return sorted_values[max(math.ceil(q * len(sorted_values)) - 1, 0)]
+
+def find_root(f, lo, hi, fprime=None, tol=1e-12, max_iter=200):
+    """
+    Root of f on [lo, hi], where f(lo) > 0 >= f(hi).
+    Newton steps (secant if no fprime) that fall outside the bracket are
+    replaced by bisection, so convergence is guaranteed.
+    """
+    f_lo, f_hi = f(lo), f(hi)
+    x = 0.5 * (lo + hi)
+    for _ in range(max_iter):
+        fx = f(x)
+        if fx > 0:
+            lo, f_lo = x, fx
+        else:
+            hi, f_hi = x, fx
+        if fprime is not None:
+            slope = fprime(x)
+        else:
+            slope = (f_hi - f_lo) / (hi - lo)
+        step = x - fx / slope if slope != 0 else lo - 1.0
+        if not lo < step < hi:
+            step = 0.5 * (lo + hi)
+        if abs(step - x) <= tol * max(1.0, abs(x)):
+            return step
+        x = step
+    return x
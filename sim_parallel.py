@@ -0,0 +1,31 @@
+"""
+Chunked Work on a Process Pool
+==============================
+The batch APIs (parameter sweeps, many fits, model selection, replicas)
+split their input into chunks and hand each chunk to a module-level worker
+function. map_chunks runs those chunks and joins the results in order:
+
+    results = map_chunks(_sweep_chunk, chunks, (t_list, scalar_t), processes=4)
+
+calls _sweep_chunk(chunk, t_list, scalar_t) for every chunk, each on a
+process pool ('processes' workers, default: all cores), or inline in the
+current process with processes=1. Every call must return a list; the lists
+are concatenated in chunk order, so the result does not depend on the
+number of processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+def map_chunks(function, chunks, args=(), processes=None):
+    """Returns function(chunk, *args) for every chunk, concatenated in order."""
+    results = []
+    if processes == 1:
+        for chunk in chunks:
+            results.extend(function(chunk, *args))
+        return results
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(function, chunk, *args) for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
@@ -0,0 +1,131 @@
+"""
+Reproducible Random Streams for the Simulations
+===============================================
+Every simulation in this repository accepts an 'rng' argument that defaults
+to the global 'random' module. Anything with the same methods works
+(random(), choice(), randint(), uniform(), ...), such as the streams handed
+out here.
+
+Streams are organised as a tree. A root seed deterministically produces
+child streams for workers and replicas, e.g.
+
+    streams = RandomStreams(seed=42)
+    rng = streams.replica(17)            # same numbers on every run/machine
+    project = SpiralProject("Drone", rng=rng)
+
+Each stream's MT19937 state is seeded from a SHA-256 digest of (root seed,
+path in the tree). Streams with different paths are therefore independent
+for simulation purposes, and never share or overlap state the way processes
+forked from one global generator do.
+
+batched(rng) gives any rng the batched draws of a Stream (randoms,
+exponentials, bernoullis, integers), so the Monte Carlo samplers can use
+them whatever rng they were handed.
+
+map_replicas runs a function over many replicas on a process pool. Replica i
+always receives streams.replica(i), so the results do not depend on the
+number of processes or on the chunking.
+"""
+
+import hashlib
+import math
+import os
+import random
+
+from sim_parallel import map_chunks
+
+class _BatchedDraws:
+    """Batched draws built on the random() and randint() of the host."""
+
+    def randoms(self, n):
+        """n uniform draws from [0, 1)."""
+        draw = self.random
+        return [draw() for _ in range(n)]
+
+    def exponentials(self, n, rate=1.0):
+        """n exponential draws with the given rate (inverse-CDF method)."""
+        draw = self.random
+        log = math.log
+        scale = 1.0 / rate
+        return [-log(1.0 - draw()) * scale for _ in range(n)]
+
+    def bernoullis(self, n, p):
+        """n booleans, each True with probability p."""
+        draw = self.random
+        return [draw() < p for _ in range(n)]
+
+    def integers(self, n, low, high):
+        """n integers from low..high inclusive (like randint)."""
+        randint = self.randint
+        return [randint(low, high) for _ in range(n)]
+
+class Stream(_BatchedDraws, random.Random):
+    """A random.Random with batched draws."""
+
+class _BatchedAdapter(_BatchedDraws):
+    def __init__(self, rng):
+        self.random = rng.random
+        self.randint = rng.randint
+
+def batched(rng):
+    """
+    'rng' with the batched draws of a Stream. Streams are returned as they
+    are; anything else (the random module, a random.Random) is wrapped, and
+    the batches consume its random() exactly as single draws would.
+    """
+    return rng if isinstance(rng, _BatchedDraws) else _BatchedAdapter(rng)
+
+class RandomStreams:
+    """
+    Tree of independent, reproducible random streams.
+
+    seed=None draws fresh entropy from the OS (non-reproducible), any other
+    int/str/bytes seed makes every derived stream reproducible.
+    """
+
+    def __init__(self, seed=None, path=()):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(32), "big")
+        self.seed = seed
+        self.path = tuple(path)
+
+    def _digest(self, path):
+        key = repr((self.seed,) + path).encode()
+        return int.from_bytes(hashlib.sha256(key).digest(), "big")
+
+    def spawn(self, *key):
+        """Child RandomStreams under 'key' (e.g. spawn("worker", 3))."""
+        return RandomStreams(self.seed, self.path + key)
+
+    def stream(self, *key):
+        """The Stream stored at 'key' below this node."""
+        return Stream(self._digest(self.path + key))
+
+    def worker(self, index):
+        return self.stream("worker", index)
+
+    def replica(self, index):
+        return self.stream("replica", index)
+
+    def replicas(self, count, start=0):
+        """Yields the replica streams start .. start+count-1."""
+        for index in range(start, start + count):
+            yield self.replica(index)
+
+def _run_replica_chunk(bounds, function, streams):
+    start, stop = bounds
+    return [function(streams.replica(index), index) for index in range(start, stop)]
+
+def map_replicas(function, replicas, seed=None, processes=None, chunk_size=10000):
+    """
+    Calls function(rng, index) for index in 0..replicas-1, where rng is
+    RandomStreams(seed).replica(index), and returns the results in order.
+
+    Chunks of 'chunk_size' replicas run on a process pool ('processes'
+    workers, default: all cores; processes=1 runs inline). 'function' must
+    be importable by the workers (a module-level function).
+    """
+    streams = RandomStreams(seed)
+    bounds = [(start, min(start + chunk_size, replicas))
+              for start in range(0, replicas, chunk_size)]
+    return map_chunks(_run_replica_chunk, bounds, (function, streams), processes)